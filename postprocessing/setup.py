@@ -16,7 +16,8 @@ setuptools.setup(
         'PyYAML',
         'matplotlib',
         'seaborn',
-        'hiplot'
+        'hiplot',
+        'scipy'
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -1,3 +1,5 @@
 import postmocot.runtime
 import postmocot.viz
 import postmocot.process
+import postmocot.hypervolume
+import postmocot.indicators
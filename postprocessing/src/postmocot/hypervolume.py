@@ -0,0 +1,627 @@
+# Hypervolume computation
+
+import numpy as np
+import pygmo
+import hashlib
+import json
+import os
+import heapq
+import tempfile
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+import postmocot
+
+# Memoized hypervolumes keyed by archive digest
+_memo = {}
+
+
+def exclusive_contribution(point, others, reference_point):
+    """
+    Hypervolume dominated by a point but not by any of the other points
+
+    Computed as the volume of the box between the point and the reference
+    point minus the hypervolume of the other points limited to that box.
+
+    Parameters
+    ----------
+    point : numpy.ndarray
+        Objective values of point
+    others : numpy.ndarray
+        An (n_points, n_objectives) array of other points
+    reference_point : numpy.ndarray
+        Reference point for hypervolume calculation
+
+    Returns
+    -------
+    float
+        Exclusive hypervolume contribution of point
+    """
+    # Box dominated by point
+    box = np.prod(reference_point - point)
+
+    # Other points limited to box (points on its boundary add no volume)
+    limited = np.maximum(others, point)
+    limited = limited[np.all(limited < reference_point, axis=1)]
+    if len(limited) == 0:
+        return box
+    limited = limited[postmocot.process.is_pareto_efficient(limited)]
+
+    # Remove volume dominated by other points
+    hv = pygmo.hypervolume(limited)
+
+    return box - hv.compute(ref_point=reference_point)
+
+
+def monte_carlo_hypervolume(
+    objectives,
+    reference_point,
+    samples=100000,
+    seed=None,
+    confidence=0.95,
+    batch_size=2**23,
+):
+    """
+    Approximate hypervolume by Monte Carlo sampling
+
+    Points are sampled uniformly in the box between the ideal point of the
+    archive and the reference point. The hypervolume is the box volume times
+    the fraction of samples dominated by the archive.
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    samples : int, optional
+        Number of samples, by default 100000
+    seed : int, optional
+        Seed of random number generator, by default None
+    confidence : float, optional
+        Level of confidence interval, by default 0.95
+    batch_size : int, optional
+        Maximum number of sample-point-objective comparisons held in memory,
+         by default 2**23
+
+    Returns
+    -------
+    tuple
+        Tuple of estimated hypervolume and lower and upper bound of its
+         confidence interval
+    """
+    # Setup (points outside reference point add no volume)
+    objectives = np.asarray(objectives, dtype=float)
+    reference_point = np.asarray(reference_point, dtype=float)
+    objectives = objectives[np.all(objectives < reference_point, axis=1)]
+    if len(objectives) == 0:
+        return 0.0, 0.0, 0.0
+    n_dominated = 0
+
+    for n_dominators, _ in _sample_dominators(
+        objectives,
+        reference_point,
+        samples,
+        seed,
+        batch_size
+    ):
+        n_dominated += np.count_nonzero(n_dominators)
+
+    # Estimate with normal approximation of binomial confidence interval
+    volume = np.prod(reference_point - objectives.min(axis=0))
+    p = n_dominated / samples
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * volume * np.sqrt(p * (1 - p) / samples)
+    estimate = volume * p
+
+    return estimate, max(estimate - half_width, 0.0), estimate + half_width
+
+
+def hypervolume_contributions(
+    objectives,
+    reference_point,
+    method='exact',
+    samples=100000,
+    seed=None,
+    batch_size=2**23,
+):
+    """
+    Exclusive hypervolume contribution of each point
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    method : str, optional
+        `'exact'` or `'mc'` (Monte Carlo approximation, much faster for many
+         objectives), by default `'exact'`
+    samples : int, optional
+        Number of Monte Carlo samples, by default 100000
+    seed : int, optional
+        Seed of Monte Carlo samples, by default None
+    batch_size : int, optional
+        Maximum number of sample-point-objective comparisons held in memory,
+         by default 2**23
+
+    Returns
+    -------
+    numpy.ndarray
+        Contribution of each point (zero for dominated, duplicate, and
+         outside reference point)
+    """
+    # Setup
+    if method not in ['exact', 'mc']:
+        raise ValueError(
+            'method must be `exact` or `mc`, got {}'.format(method)
+        )
+    objectives = np.asarray(objectives, dtype=float)
+    reference_point = np.asarray(reference_point, dtype=float)
+    contributions = np.zeros(len(objectives))
+    inside = np.all(objectives < reference_point, axis=1)
+    points = objectives[inside]
+    if len(points) == 0:
+        return contributions
+
+    if method == 'exact':
+        hv = pygmo.hypervolume(points)
+        contributions[inside] = hv.contributions(reference_point)
+    else:
+        # Samples dominated by exactly one point
+        counts = np.zeros(len(points))
+        for n_dominators, dominator in _sample_dominators(
+            points,
+            reference_point,
+            samples,
+            seed,
+            batch_size
+        ):
+            counts += np.bincount(
+                dominator[n_dominators == 1],
+                minlength=len(points)
+            )
+        volume = np.prod(reference_point - points.min(axis=0))
+        contributions[inside] = volume * counts / samples
+
+    return contributions
+
+
+def greedy_subset(objectives, reference_point, k):
+    """
+    Subset of points with largest hypervolume by lazy greedy selection
+
+    Points are added one at a time by largest exclusive contribution to the
+    points already selected. Contributions only shrink as points are added,
+    so stale contributions are upper bounds and are only recomputed for the
+    best candidate.
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    k : int
+        Number of points to select
+
+    Returns
+    -------
+    tuple
+        Tuple of indices of selected points in order of selection and
+         hypervolume gained by each
+    """
+    # Setup
+    objectives = np.asarray(objectives, dtype=float)
+    reference_point = np.asarray(reference_point, dtype=float)
+    inside = np.flatnonzero(np.all(objectives < reference_point, axis=1))
+    heap = [(-np.prod(reference_point - objectives[i]), i) for i in inside]
+    heapq.heapify(heap)
+    selected = []
+    gains = []
+
+    while heap and len(selected) < k:
+        _, i = heapq.heappop(heap)
+        gain = exclusive_contribution(
+            objectives[i],
+            objectives[selected].reshape(-1, objectives.shape[1]),
+            reference_point
+        )
+        if heap and gain < -heap[0][0]:
+            # Another candidate may be better
+            heapq.heappush(heap, (-gain, i))
+        elif gain > 0:
+            selected.append(int(i))
+            gains.append(float(gain))
+        else:
+            break
+
+    return selected, gains
+
+
+def _sample_dominators(objectives, reference_point, samples, seed, batch_size):
+    """
+    Dominating points of uniform samples between ideal and reference point
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    samples : int
+        Number of samples
+    seed : int
+        Seed of random number generator
+    batch_size : int
+        Maximum number of sample-point-objective comparisons held in memory
+
+    Yields
+    ------
+    tuple
+        Tuple of number of dominating points and index of a dominating point
+         of each sample in batch
+    """
+    # Setup
+    reference_point = np.asarray(reference_point, dtype=float)
+    n_points, n_objectives = objectives.shape
+    rng = np.random.default_rng(seed)
+    lower = objectives.min(axis=0)
+
+    # Batches of samples and points
+    point_batch = max(1, min(n_points, batch_size // (1024 * n_objectives)))
+    sample_batch = max(1, batch_size // (point_batch * n_objectives))
+
+    for start in range(0, samples, sample_batch):
+        x = rng.uniform(
+            lower,
+            reference_point,
+            size=(min(sample_batch, samples - start), n_objectives)
+        )
+        n_dominators = np.zeros(len(x), dtype=int)
+        dominator = np.zeros(len(x), dtype=int)
+        for j in range(0, n_points, point_batch):
+            points = objectives[j:j+point_batch]
+            dominated = np.all(points[None, :, :] <= x[:, None, :], axis=2)
+            n_dominators += dominated.sum(axis=1)
+            found = dominated.any(axis=1)
+            dominator[found] = j + dominated[found].argmax(axis=1)
+        yield n_dominators, dominator
+
+
+class HypervolumeTracker:
+    """
+    Hypervolume of successive archive snapshots
+    """
+    def __init__(
+        self,
+        reference_point,
+        incremental=False,
+        max_changed=0.1
+    ):
+        """
+        Initilization
+
+        Incremental updates cost one box-limited hypervolume per changed
+        point. Exact recomputation is fast for up to three objectives, while
+        for more objectives a contribution costs roughly a fraction
+        `(n_objectives - 3) * log10(n_points)` of it, so snapshots with more
+        changed points than a third of that fraction are recomputed exactly.
+
+        Parameters
+        ----------
+        reference_point : list
+            Reference point for hypervolume calculation. Length must be same
+             as objectives
+        incremental : bool, optional
+            Update hypervolume from the points added to and removed from the
+             previous snapshot when few points changed, by default False
+        max_changed : float, optional
+            Fraction of changed points above which the hypervolume is always
+             recomputed exactly, by default 0.1
+        """
+        self.reference_point = np.asarray(reference_point, dtype=float)
+        self.incremental = incremental
+        self.max_changed = max_changed
+        self.points = {}
+        self.value = None
+
+    def update(self, objectives):
+        """
+        Compute hypervolume of next snapshot
+
+        Parameters
+        ----------
+        objectives : numpy.ndarray
+            An (n_points, n_objectives) array of archive objectives
+
+        Returns
+        -------
+        float
+            Hypervolume
+        """
+        # Points keyed by their values
+        objectives = np.asarray(objectives, dtype=float)
+        points = {row.tobytes(): row for row in objectives}
+        removed = [k for k in self.points if k not in points]
+        added = [k for k in points if k not in self.points]
+
+        # Check whether update is possible and cheaper than recomputation
+        n_changed = len(removed) + len(added)
+        update = \
+            self.incremental and \
+            self.value is not None and \
+            len(points) > 0 and \
+            n_changed <= self.max_changed * len(points) and \
+            n_changed <= self._max_incremental(objectives.shape) and \
+            np.all(objectives <= self.reference_point)
+
+        if update:
+            # Remove contributions of removed points
+            current = dict(self.points)
+            for k in removed:
+                point = current.pop(k)
+                self.value -= self._contribution(point, current)
+
+            # Add contributions of added points
+            for k in added:
+                self.value += self._contribution(points[k], current)
+                current[k] = points[k]
+        elif len(points) == 0:
+            self.value = 0.0
+        else:
+            # Exact recomputation
+            hv = pygmo.hypervolume(objectives)
+            self.value = hv.compute(ref_point=self.reference_point)
+
+        self.points = points
+
+        return self.value
+
+    def _max_incremental(self, shape):
+        """
+        Number of changed points up to which an update is cheaper than exact
+        recomputation
+
+        Parameters
+        ----------
+        shape : tuple
+            Number of points and objectives of snapshot
+
+        Returns
+        -------
+        float
+            Maximum number of changed points (zero for up to three
+             objectives)
+        """
+        n_points, n_objectives = shape
+        if n_objectives <= 3 or n_points < 2:
+            return 0.0
+
+        return (n_objectives - 3) * np.log10(n_points) / 3
+
+    def _contribution(self, point, current):
+        """
+        Exclusive contribution of point with respect to current points
+
+        Parameters
+        ----------
+        point : numpy.ndarray
+            Objective values of point
+        current : dict
+            Current points keyed by their values
+
+        Returns
+        -------
+        float
+            Exclusive hypervolume contribution of point
+        """
+        if current:
+            others = np.array(list(current.values()))
+        else:
+            others = np.empty((0, len(point)))
+
+        return exclusive_contribution(point, others, self.reference_point)
+
+
+def archive_digest(objectives, reference_point, method='exact'):
+    """
+    Digest identifying the hypervolume of an archive
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    method : str, optional
+        Hypervolume method, by default 'exact'
+
+    Returns
+    -------
+    str
+        SHA-1 hex digest of archive, reference point, and method
+    """
+    objectives = np.ascontiguousarray(objectives, dtype=float)
+    sha = hashlib.sha1()
+    sha.update(str(objectives.shape).encode())
+    sha.update(objectives.tobytes())
+    sha.update(np.asarray(reference_point, dtype=float).tobytes())
+    sha.update(method.encode())
+
+    return sha.hexdigest()
+
+
+def compute_hypervolumes(
+    archives,
+    reference_point,
+    method='exact',
+    workers=1,
+    memoize=True,
+    path_to_cache=None,
+    samples=100000,
+    seed=None,
+    confidence=0.95,
+):
+    """
+    Compute hypervolumes of multiple archives
+
+    Results are memoized in memory and optionally on disk by a digest of the
+    archive and reference point, so only unseen archives are computed.
+    Monte Carlo estimates are only memoized if seeded.
+
+    Parameters
+    ----------
+    archives : list
+        Sequence of (n_points, n_objectives) arrays of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    method : str, optional
+        `'exact'`, `'incremental'` (consecutive archives of more than three
+         objectives with few changed points are updated from their
+         differences), or `'mc'` (Monte Carlo approximation), by default
+         `'exact'`
+    workers : int, optional
+        Number of processes to spread archives across, by default 1
+    memoize : bool, optional
+        Reuse and store results in memory, by default True
+    path_to_cache : str, optional
+        JSON file of memoized results to reuse and extend, by default None
+    samples : int, optional
+        Number of Monte Carlo samples per archive, by default 100000
+    seed : int, optional
+        Seed of Monte Carlo samples, by default None
+    confidence : float, optional
+        Level of Monte Carlo confidence interval, by default 0.95
+
+    Returns
+    -------
+    list
+        Hypervolume of each archive. For `'mc'`, tuples of estimate and lower
+         and upper bound of confidence interval
+    """
+    # Setup
+    if method == 'mc':
+        options = (samples, seed, confidence)
+        method_key = 'mc:{}:{}:{}'.format(*options)
+        if seed is None:
+            memoize = False
+            path_to_cache = None
+    else:
+        options = ()
+        method_key = method
+    digests = [
+        archive_digest(i, reference_point, method_key) for i in archives
+    ]
+    memo = _memo if memoize else {}
+    if path_to_cache is not None:
+        memo.update(_read_memo(path_to_cache))
+
+    # Compute missing hypervolumes in contiguous chunks
+    missing = [i for i, digest in enumerate(digests) if digest not in memo]
+    if missing:
+        n_chunks = min(workers, len(missing))
+        chunks = [
+            [archives[i] for i in idx]
+            for idx in np.array_split(missing, n_chunks)
+        ]
+        args = [reference_point, method, options]
+        if n_chunks == 1:
+            results = [_hypervolume_chunk(chunks[0], *args)]
+        else:
+            with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+                results = list(executor.map(
+                    _hypervolume_chunk,
+                    chunks,
+                    *[[arg] * n_chunks for arg in args]
+                ))
+        values = [value for result in results for value in result]
+        for i, value in zip(missing, values):
+            memo[digests[i]] = value
+
+    # Store on disk
+    if path_to_cache is not None and missing:
+        cached = _read_memo(path_to_cache)
+        cached.update({digest: memo[digest] for digest in digests})
+        path_to_temp = None
+        try:
+            # Write unique temporary file then move to avoid partial files
+            fd, path_to_temp = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(path_to_cache)),
+                suffix='.json'
+            )
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f)
+            os.replace(path_to_temp, path_to_cache)
+        except OSError:
+            # Cache is optional (e.g., read-only directory)
+            if path_to_temp is not None and os.path.exists(path_to_temp):
+                os.remove(path_to_temp)
+
+    if method == 'mc':
+        return [tuple(memo[digest]) for digest in digests]
+
+    return [memo[digest] for digest in digests]
+
+
+def _read_memo(path_to_cache):
+    """
+    Read memoized hypervolumes from JSON file
+
+    Parameters
+    ----------
+    path_to_cache : str
+        JSON file of memoized results
+
+    Returns
+    -------
+    dict
+        Memoized results keyed by archive digest, empty if the file does not
+         exist or cannot be read (e.g., truncated)
+    """
+    try:
+        with open(path_to_cache, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict):
+        return {}
+
+    return cached
+
+
+def _hypervolume_chunk(archives, reference_point, method, options=()):
+    """
+    Compute hypervolumes of consecutive archives (process pool worker)
+
+    Parameters
+    ----------
+    archives : list
+        Sequence of (n_points, n_objectives) arrays of archive objectives
+    reference_point : list
+        Reference point for hypervolume calculation
+    method : str
+        `'exact'`, `'incremental'`, or `'mc'`
+    options : tuple, optional
+        Monte Carlo samples, seed, and confidence
+
+    Returns
+    -------
+    list
+        Hypervolume of each archive
+    """
+    if method == 'mc':
+        return [
+            [float(i) for i in monte_carlo_hypervolume(
+                objectives,
+                reference_point,
+                *options
+            )]
+            for objectives in archives
+        ]
+
+    tracker = HypervolumeTracker(
+        reference_point,
+        incremental=(method == 'incremental')
+    )
+
+    return [tracker.update(objectives) for objectives in archives]
@@ -0,0 +1,252 @@
+# Quality indicators
+
+import numpy as np
+
+# Indicator names, also the attribute names of computed values
+INDICATORS = [
+    'generational_distance',
+    'inverted_generational_distance',
+    'additive_epsilon',
+    'spacing',
+]
+
+
+def nearest_distances(
+    points,
+    others,
+    metric='euclidean',
+    exclude_self=False,
+    batch_size=2**16,
+):
+    """
+    Distance from each point to its nearest other point
+
+    Distances are computed in blocks of points and other points so the full
+    distance matrix is never held in memory. Euclidean blocks use matrix
+    products to find the nearest other point, whose distance is then
+    recomputed exactly.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        An (n_points, n_objectives) array
+    others : numpy.ndarray
+        An (n_others, n_objectives) array
+    metric : str, optional
+        `'euclidean'`, `'cityblock'`, or `'epsilon'` (smallest value that,
+         subtracted from the other point, makes it weakly dominate the
+         point), by default `'euclidean'`
+    exclude_self : bool, optional
+        Ignore the other point of the same index (points and others are the
+         same array), by default False
+    batch_size : int, optional
+        Maximum number of point-other pairs held in memory, by default 2**16
+
+    Returns
+    -------
+    numpy.ndarray
+        Distance of each point to its nearest other point, `inf` if there are
+         no other points
+    """
+    # Setup
+    if metric not in ['euclidean', 'cityblock', 'epsilon']:
+        raise ValueError(
+            'metric must be `euclidean`, `cityblock`, or `epsilon`, got {}'
+            .format(metric)
+        )
+    points = np.asarray(points, dtype=float)
+    others = np.asarray(others, dtype=float)
+    n_points = len(points)
+    n_others = len(others)
+    distances = np.full(n_points, np.inf)
+    nearest = np.zeros(n_points, dtype=int)
+    if n_points == 0 or n_others == 0:
+        return distances
+
+    # Center to reduce cancellation in matrix products
+    if metric == 'euclidean':
+        center = others.mean(axis=0)
+        points = points - center
+        others = others - center
+        others_sq = np.einsum('ij,ij->i', others, others)
+
+    # Batches of points and others
+    other_batch = max(1, min(n_others, batch_size // 1024))
+    point_batch = max(1, batch_size // other_batch)
+
+    for i in range(0, n_points, point_batch):
+        x = points[i:i+point_batch]
+        for j in range(0, n_others, other_batch):
+            y = others[j:j+other_batch]
+            if metric == 'euclidean':
+                d = others_sq[None, j:j+len(y)] - 2 * x @ y.T
+            elif metric == 'cityblock':
+                d = np.zeros((len(x), len(y)))
+                diff = np.empty_like(d)
+                for k in range(x.shape[1]):
+                    np.subtract(y[None, :, k], x[:, k, None], out=diff)
+                    d += np.abs(diff, out=diff)
+            else:
+                d = np.full((len(x), len(y)), -np.inf)
+                for k in range(x.shape[1]):
+                    np.maximum(d, y[None, :, k] - x[:, k, None], out=d)
+            if exclude_self:
+                rows = np.arange(i, i + len(x))[:, None]
+                cols = np.arange(j, j + len(y))[None, :]
+                d[rows == cols] = np.inf
+            idx = d.argmin(axis=1)
+            d_min = d[np.arange(len(x)), idx]
+            better = d_min < distances[i:i+len(x)]
+            distances[i:i+len(x)][better] = d_min[better]
+            nearest[i:i+len(x)][better] = idx[better] + j
+
+    # Exact distance to nearest other point
+    if metric == 'euclidean':
+        found = np.isfinite(distances)
+        distances[found] = np.linalg.norm(
+            points[found] - others[nearest[found]],
+            axis=1
+        )
+
+    return distances
+
+
+def generational_distance(objectives, reference_set):
+    """
+    Generational distance (mean distance of archive to reference set)
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_set : numpy.ndarray
+        An (n_reference, n_objectives) array of reference objectives
+
+    Returns
+    -------
+    float
+        Generational distance, `nan` for an empty archive
+    """
+    if len(objectives) == 0:
+        return np.nan
+
+    return float(np.mean(nearest_distances(objectives, reference_set)))
+
+
+def inverted_generational_distance(objectives, reference_set):
+    """
+    Inverted generational distance (mean distance of reference set to archive)
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_set : numpy.ndarray
+        An (n_reference, n_objectives) array of reference objectives
+
+    Returns
+    -------
+    float
+        Inverted generational distance, `inf` for an empty archive
+    """
+    return float(np.mean(nearest_distances(reference_set, objectives)))
+
+
+def additive_epsilon(objectives, reference_set):
+    """
+    Additive epsilon indicator
+
+    Smallest value that, subtracted from every archive point, makes the
+    archive weakly dominate the reference set (all objectives minimized).
+    Computed as the maximum over reference points of the minimum over
+    archive points of the largest objective difference (archive minus
+    reference).
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+    reference_set : numpy.ndarray
+        An (n_reference, n_objectives) array of reference objectives
+
+    Returns
+    -------
+    float
+        Additive epsilon indicator, `inf` for an empty archive
+    """
+    return float(np.max(
+        nearest_distances(reference_set, objectives, metric='epsilon')
+    ))
+
+
+def spacing(objectives):
+    """
+    Schott's spacing (standard deviation of nearest neighbor distances)
+
+    Parameters
+    ----------
+    objectives : numpy.ndarray
+        An (n_points, n_objectives) array of archive objectives
+
+    Returns
+    -------
+    float
+        Spacing, 0 for archives of fewer than two points
+    """
+    if len(objectives) < 2:
+        return 0.0
+    d = nearest_distances(
+        objectives,
+        objectives,
+        metric='cityblock',
+        exclude_self=True
+    )
+
+    return float(np.std(d, ddof=1))
+
+
+def compute_indicators(archives, reference_set, normalize=False):
+    """
+    Compute quality indicators of multiple archives
+
+    Parameters
+    ----------
+    archives : list
+        Sequence of (n_points, n_objectives) arrays of archive objectives
+    reference_set : numpy.ndarray
+        An (n_reference, n_objectives) array of reference objectives
+    normalize : bool, optional
+        Scale objectives to the range of the reference set before computing,
+         by default False
+
+    Returns
+    -------
+    dict
+        Values of each archive keyed by indicator name
+    """
+    # Setup
+    reference_set = np.asarray(reference_set, dtype=float)
+    if normalize:
+        lower = reference_set.min(axis=0)
+        scale = reference_set.max(axis=0) - lower
+        scale[scale == 0] = 1.0
+    else:
+        lower = 0.0
+        scale = 1.0
+    reference_set = (reference_set - lower) / scale
+    values = {name: [] for name in INDICATORS}
+
+    for objectives in archives:
+        objectives = (np.asarray(objectives, dtype=float) - lower) / scale
+        values['generational_distance'].append(
+            generational_distance(objectives, reference_set)
+        )
+        values['inverted_generational_distance'].append(
+            inverted_generational_distance(objectives, reference_set)
+        )
+        values['additive_epsilon'].append(
+            additive_epsilon(objectives, reference_set)
+        )
+        values['spacing'].append(spacing(objectives))
+
+    return values
@@ -1,12 +1,22 @@
 
 import pandas as pd
 import numpy as np
+import bisect
+import os
+import zipfile
+from scipy.spatial import cKDTree
 import postmocot
 
 
 def is_pareto_efficient(costs, return_mask=True):
     """Find the pareto-efficient points
-    https://stackoverflow.com/questions/51397669/imports-inside-package-now-that-init-py-is-optional
+
+    Points that are not strictly dominated are kept, with only the first of
+    duplicate points. Duplicates are dropped first, then the filter is chosen
+    by the number of costs: a sort-based sweep for two costs, a sweep with a
+    staircase of the best points for three costs, and a blocked vectorized
+    filter of points sorted by cost sum for more costs.
+
     Parameters
     ----------
     costs : array
@@ -18,19 +28,28 @@ def is_pareto_efficient(costs, return_mask=True):
     array
         An array of indices of pareto-efficient points.
     """
-    is_efficient = np.arange(costs.shape[0])
+    # Setup
+    costs = np.asarray(costs)
     n_points = costs.shape[0]
-    next_point_index = 0  # Next index in the is_efficient array to search for
-    while next_point_index < len(costs):
-        nondominated_point_mask = np.any(
-            costs < costs[next_point_index], axis=1
-        )
-        nondominated_point_mask[next_point_index] = True
 
-        # Remove dominated points
-        is_efficient = is_efficient[nondominated_point_mask]
-        costs = costs[nondominated_point_mask]
-        next_point_index = np.sum(nondominated_point_mask[:next_point_index])+1
+    # First of duplicate points
+    _, unique_idx = np.unique(_row_keys(costs), return_index=True)
+    unique_costs = costs[unique_idx]
+
+    # Nondominated unique points
+    n_costs = costs.shape[1]
+    if n_points == 0:
+        nondom_idx = np.empty(0, dtype=int)
+    elif n_costs == 1:
+        nondom_idx = np.array([np.argmin(unique_costs[:, 0])])
+    elif n_costs == 2:
+        nondom_idx = _sweep_2d(unique_costs)
+    elif n_costs == 3:
+        nondom_idx = _sweep_3d(unique_costs)
+    else:
+        nondom_idx = _blocked_filter(unique_costs)
+    is_efficient = np.sort(unique_idx[nondom_idx])
+
     if return_mask:
         is_efficient_mask = np.zeros(n_points, dtype=bool)
         is_efficient_mask[is_efficient] = True
@@ -39,6 +58,239 @@ def is_pareto_efficient(costs, return_mask=True):
         return is_efficient
 
 
+def _row_keys(array):
+    """
+    Rows of array as single values compared by their raw bytes
+
+    Parameters
+    ----------
+    array : array
+        An (n_rows, n_columns) array
+
+    Returns
+    -------
+    array
+        Key of each row, equal for rows of equal values (adding zero removes
+         negative zeros)
+    """
+    rows = np.ascontiguousarray(np.asarray(array) + 0)
+    rows = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])))
+
+    return rows.reshape(-1)
+
+
+def _sweep_2d(costs):
+    """Nondominated filter of distinct points with two costs
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, 2) array of distinct points
+
+    Returns
+    -------
+    array
+        Indices of nondominated points
+    """
+    # Points sorted by first then second cost are nondominated if they
+    # improve on the best second cost so far
+    order = np.lexsort((costs[:, 1], costs[:, 0]))
+    second = costs[order, 1]
+    best = np.minimum.accumulate(second)
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = second[1:] < best[:-1]
+
+    return order[keep]
+
+
+def _sweep_3d(costs):
+    """Nondominated filter of distinct points with three costs
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, 3) array of distinct points
+
+    Returns
+    -------
+    array
+        Indices of nondominated points
+    """
+    # Points sorted by costs can only be dominated by previous points
+    order = np.lexsort((costs[:, 2], costs[:, 1], costs[:, 0]))
+    second = costs[order, 1].tolist()
+    third = costs[order, 2].tolist()
+
+    # Staircase of nondominated previous points in last two costs (second
+    # cost increasing, third cost decreasing)
+    stair_second = []
+    stair_third = []
+    keep = []
+    for i, (a, b) in enumerate(zip(second, third)):
+        # Dominated by best previous point with no greater second cost
+        j = bisect.bisect_right(stair_second, a)
+        if j > 0 and stair_third[j-1] <= b:
+            continue
+
+        # Replace staircase points dominated by point
+        start = bisect.bisect_left(stair_second, a)
+        end = start
+        while end < len(stair_third) and stair_third[end] >= b:
+            end += 1
+        stair_second[start:end] = [a]
+        stair_third[start:end] = [b]
+        keep.append(i)
+
+    return order[keep]
+
+
+def _blocked_filter(costs, block_size=1024, batch_size=2**22):
+    """Nondominated filter of distinct points with any number of costs
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, n_costs) array of distinct points
+    block_size : int, optional
+        Number of points filtered together, by default 1024
+    batch_size : int, optional
+        Maximum number of point comparisons held in memory, by default 2**22
+
+    Returns
+    -------
+    array
+        Indices of nondominated points
+    """
+    # Points sorted by cost sum (then costs) can only be dominated by
+    # previous points
+    n_points, n_costs = costs.shape
+    keys = tuple(costs[:, k] for k in reversed(range(n_costs)))
+    order = np.lexsort(keys + (costs.sum(axis=1),))
+    costs = costs[order]
+
+    # Nondominated points found so far
+    front = np.empty_like(costs)
+    n_front = 0
+    keep = []
+    front_batch = max(1, batch_size // block_size)
+
+    for start in range(0, n_points, block_size):
+        block = costs[start:start+block_size]
+        block_idx = np.arange(start, start + len(block))
+
+        # Remove points dominated by previous blocks
+        for i in range(0, n_front, front_batch):
+            previous = front[i:min(i + front_batch, n_front)]
+            dominated = np.ones((len(previous), len(block)), dtype=bool)
+            for k in range(n_costs):
+                dominated &= previous[:, k, None] <= block[None, :, k]
+            alive = ~dominated.any(axis=0)
+            block = block[alive]
+            block_idx = block_idx[alive]
+            if len(block) == 0:
+                break
+
+        # Remove points dominated by previous points in block
+        dominated = np.ones((len(block), len(block)), dtype=bool)
+        for k in range(n_costs):
+            dominated &= block[:, k, None] <= block[None, :, k]
+        alive = ~np.triu(dominated, 1).any(axis=0)
+
+        # Store
+        front[n_front:n_front+np.sum(alive)] = block[alive]
+        n_front += np.sum(alive)
+        keep.append(block_idx[alive])
+
+    return order[np.concatenate(keep)]
+
+
+def prefix_pareto_efficient(costs, batch_size=2**22):
+    """Find the pareto-efficient points for each prefix of the costs
+
+    Equivalent to calling `is_pareto_efficient` on the first one, two, ...
+    costs, but dominance relations are extended one cost at a time instead
+    of recomputed for every prefix.
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, n_costs) array
+    batch_size : int, optional
+        Maximum number of point comparisons held in memory, by default 2**22
+
+    Returns
+    -------
+    array
+        An (n_costs, n_points) mask of pareto-efficient points of each prefix
+    """
+    # Setup
+    costs = np.asarray(costs)
+    n_points, n_costs = costs.shape
+    is_efficient = np.ones((n_costs, n_points), dtype=bool)
+    block_size = max(1, batch_size // max(n_points, 1))
+    previous = np.arange(n_points)[:, None]
+
+    for start in range(0, n_points, block_size):
+        block = costs[start:start+block_size]
+        block_idx = np.arange(start, start + len(block))[None, :]
+
+        # Points are removed by points at least as good in every cost of the
+        # prefix that are better in one cost or are earlier duplicates
+        at_least_as_good = np.ones((n_points, len(block)), dtype=bool)
+        better = previous < block_idx
+        for k in range(n_costs):
+            at_least_as_good &= costs[:, k, None] <= block[None, :, k]
+            better |= costs[:, k, None] < block[None, :, k]
+            is_efficient[k, start:start+len(block)] = \
+                ~np.any(at_least_as_good & better, axis=0)
+
+    return is_efficient
+
+
+def epsilon_nondominated(costs, epsilons):
+    """Find the epsilon-box nondominated points
+
+    Points are assigned to boxes of size epsilons. Boxes are dominated if
+    another box is at least as good in every objective. Each nondominated box
+    keeps its point nearest to the box corner, as in the Borg archive.
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, n_costs) array
+    epsilons : list
+        Box size of each cost
+
+    Returns
+    -------
+    array
+        Sorted array of indices of epsilon-box nondominated points
+    """
+    # Box of each point
+    scaled = np.asarray(costs, dtype=float) / np.asarray(epsilons, dtype=float)
+    boxes = np.floor(scaled)
+    corner_distance = np.sum((scaled - boxes)**2, axis=1)
+
+    # Unique boxes
+    _, box_idx = np.unique(_row_keys(boxes), return_inverse=True)
+    box_idx = box_idx.reshape(-1)
+
+    # Point nearest corner of each box (first point on ties)
+    order = np.lexsort((
+        np.arange(len(box_idx)),
+        corner_distance,
+        box_idx
+    ))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = box_idx[order[1:]] != box_idx[order[:-1]]
+    idx = order[first]
+
+    # Nondominated boxes
+    idx = idx[is_pareto_efficient(boxes[idx])]
+
+    return np.sort(idx)
+
+
 def get_nondomintated(df, objs, max_objs=None):
     """
     Get nondominate filtered DataFrame
@@ -70,6 +322,716 @@ def get_nondomintated(df, objs, max_objs=None):
     return df_nondom
 
 
+def pareto_ranks(costs, block_size=512, batch_size=2**20):
+    """Find the pareto rank of points
+
+    Points of rank 1 are nondominated, points of rank 2 are only dominated by
+    points of rank 1, and so on. Equal points share a rank. Each point's rank
+    is one more than the highest rank of the points dominating it, found in
+    blocks of points sorted by cost sum (dominating points come first).
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, n_costs) array
+    block_size : int, optional
+        Number of points ranked together, by default 512
+    batch_size : int, optional
+        Maximum number of point comparisons held in memory, by default 2**20
+
+    Returns
+    -------
+    array
+        Pareto rank of each point
+    """
+    # Distinct points
+    costs = np.asarray(costs)
+    _, unique_idx, inverse = np.unique(
+        _row_keys(costs),
+        return_index=True,
+        return_inverse=True
+    )
+    unique_costs = costs[unique_idx]
+    n_points, n_costs = unique_costs.shape
+
+    # Sort by cost sum (then costs)
+    keys = tuple(unique_costs[:, k] for k in reversed(range(n_costs)))
+    order = np.lexsort(keys + (unique_costs.sum(axis=1),))
+    unique_costs = unique_costs[order]
+    ranks = np.zeros(n_points, dtype=int)
+    previous_batch = max(1, batch_size // block_size)
+
+    for start in range(0, n_points, block_size):
+        block = unique_costs[start:start+block_size]
+        block_ranks = np.ones(len(block), dtype=int)
+
+        # Ranks from dominating points of previous blocks (latest first, so
+        # blocks that cannot raise any rank are skipped)
+        for end in range(start, 0, -previous_batch):
+            i = max(end - previous_batch, 0)
+            if np.all(block_ranks > ranks[i:end].max()):
+                continue
+            dominated = np.ones((end - i, len(block)), dtype=bool)
+            for k in range(n_costs):
+                dominated &= unique_costs[i:end, k, None] <= block[None, :, k]
+            block_ranks = np.maximum(
+                block_ranks,
+                np.max(dominated * (ranks[i:end, None] + 1), axis=0)
+            )
+
+        # Ranks from dominating points of block (longest dominance chains)
+        dominated = np.ones((len(block), len(block)), dtype=bool)
+        for k in range(n_costs):
+            dominated &= block[:, k, None] <= block[None, :, k]
+        dominated = np.triu(dominated, 1)
+        while True:
+            updated = np.maximum(
+                block_ranks,
+                np.max(dominated * (block_ranks[:, None] + 1), axis=0)
+            )
+            if np.array_equal(updated, block_ranks):
+                break
+            block_ranks = updated
+        ranks[start:start+len(block)] = block_ranks
+
+    # Ranks of all points
+    unique_ranks = np.empty(n_points, dtype=int)
+    unique_ranks[order] = ranks
+
+    return unique_ranks[inverse.reshape(-1)]
+
+
+def crowding_distance(costs, ranks):
+    """Find the crowding distance of points within their pareto rank
+
+    Parameters
+    ----------
+    costs : array
+        An (n_points, n_costs) array
+    ranks : array
+        Pareto rank of each point
+
+    Returns
+    -------
+    array
+        Sum over costs of the normalized distance between the neighbors of
+         each point in its rank, infinite for the extreme points of a rank
+    """
+    # Setup
+    costs = np.asarray(costs, dtype=float)
+    ranks = np.asarray(ranks)
+    n_points, n_costs = costs.shape
+    distance = np.zeros(n_points)
+
+    for k in range(n_costs):
+        # Points sorted by cost within each rank
+        order = np.lexsort((costs[:, k], ranks))
+        values = costs[order, k]
+        sorted_ranks = ranks[order]
+        first = np.ones(n_points, dtype=bool)
+        first[1:] = sorted_ranks[1:] != sorted_ranks[:-1]
+        last = np.ones(n_points, dtype=bool)
+        last[:-1] = first[1:]
+
+        # Range of cost within each rank
+        starts = np.flatnonzero(first)
+        ends = np.flatnonzero(last)
+        span = np.repeat(values[ends] - values[starts], ends - starts + 1)
+
+        # Normalized distance between neighbors
+        gap = np.zeros(n_points)
+        interior = ~(first | last) & (span > 0)
+        idx = np.flatnonzero(interior)
+        gap[idx] = (values[idx+1] - values[idx-1]) / span[idx]
+        gap[first | last] = np.inf
+        distance[order] += gap
+
+    return distance
+
+
+def nondominated_sort(df, objs, max_objs=None):
+    """
+    Get pareto rank and crowding distance of every row
+
+    Parameters
+    ----------
+    df: DataFrame
+        DataFrame for nondominated sorting
+    objs: list
+        List of strings correspond to column names of objectives
+    max_objs: list (Optional)
+        List of objective to maximize
+
+    Returns
+    -------
+    df_sorted: DataFrame
+        Copy of DataFrame with `rank` (1 for nondominated rows) and
+         `crowding_distance` columns
+    """
+    # Get flip maximum objectives
+    df_temp = df.copy()
+    try:
+        df_temp[max_objs] = -1.0*df_temp[max_objs]
+    except KeyError:
+        pass
+
+    # Nondominated sorting
+    costs = df_temp[objs].values
+    ranks = pareto_ranks(costs)
+    df_sorted = df.copy()
+    df_sorted['rank'] = ranks
+    df_sorted['crowding_distance'] = crowding_distance(costs, ranks)
+
+    return df_sorted
+
+
+def get_nondominated_chunked(chunks, objs, max_objs=None):
+    """
+    Get nondominate filtered DataFrame from chunks of rows
+
+    Only the nondominated rows seen so far and the current chunk are held in
+    memory. The result is the same as `get_nondomintated` of all chunks
+    concatenated.
+
+    Parameters
+    ----------
+    chunks: iterable
+        DataFrames of consecutive rows, e.g., from `read_chunks`
+    objs: list
+        List of strings correspond to column names of objectives
+    max_objs: list (Optional)
+        List of objective to maximize
+
+    Returns
+    -------
+    df_nondom: DataFrame
+        Nondominatated DataFrame
+    """
+    df_nondom = None
+
+    for df_chunk in chunks:
+        # Nondominated rows of chunk
+        df_chunk = get_nondomintated(df_chunk, objs, max_objs)
+
+        # Merge with previous nondominated rows (previous rows come first so
+        # they are kept over later duplicates)
+        if df_nondom is not None:
+            df_chunk = get_nondomintated(
+                pd.concat([df_nondom, df_chunk], ignore_index=True),
+                objs,
+                max_objs
+            )
+        df_nondom = df_chunk
+
+    return df_nondom
+
+
+def read_chunks(path, chunk_size=100000, columns=None, keys=None):
+    """
+    Stream rows of a Parquet, npz, or csv file
+
+    Parameters
+    ----------
+    path : str
+        Path to `.parquet`, `.npz`, or `.csv` file
+    chunk_size : int, optional
+        Number of rows per chunk, by default 100000
+    columns : list, optional
+        Columns to read (Parquet and csv) or names of columns (npz), by
+         default all columns
+    keys : list, optional
+        Arrays of npz file placed side by side, by default all
+         two-dimensional arrays
+
+    Yields
+    ------
+    pandas.DataFrame
+        Chunk of rows
+    """
+    extension = os.path.splitext(path)[1]
+    if extension == '.parquet':
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(
+            batch_size=chunk_size,
+            columns=columns
+        ):
+            yield batch.to_pandas()
+    elif extension == '.npz':
+        yield from _read_npz_chunks(path, chunk_size, columns, keys)
+    elif extension == '.csv':
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=columns)
+    else:
+        raise ValueError(
+            'file must be `.parquet`, `.npz`, or `.csv`, got {}'.format(path)
+        )
+
+
+def read_runtime_chunks(path, n_decisions, n_objectives, n_metrics):
+    """
+    Stream archive snapshots of Borg MOEA runtime file
+
+    Parameters
+    ----------
+    path : str
+        Path to Borg MOEA runtime file
+    n_decisions : int
+        Number of decisions
+    n_objectives : int
+        Number of objectives
+    n_metrics : int
+        Number of metrics
+
+    Yields
+    ------
+    pandas.DataFrame
+        Decisions, objectives, and metrics of snapshot with default names
+         of `BorgRuntimeDiagnostic` and NFE of snapshot
+    """
+    columns = \
+        ['decision_' + str(i+1) for i in range(n_decisions)] + \
+        ['objective_' + str(i+1) for i in range(n_objectives)] + \
+        ['metric_' + str(i+1) for i in range(n_metrics)]
+
+    for nfe, decisions, objectives, metrics in \
+            postmocot.runtime.iter_archives(
+                path,
+                n_decisions,
+                n_objectives,
+                n_metrics
+            ):
+        df = pd.DataFrame(
+            np.concatenate([decisions, objectives, metrics], axis=1),
+            columns=columns
+        )
+        df['nfe'] = nfe
+        yield df
+
+
+def _read_npz_chunks(path, chunk_size, columns=None, keys=None):
+    """
+    Stream rows of two-dimensional arrays in npz file
+
+    Parameters
+    ----------
+    path : str
+        Path to npz file
+    chunk_size : int
+        Number of rows per chunk
+    columns : list, optional
+        Names of columns, by default `<key>_<column number>`
+    keys : list, optional
+        Arrays placed side by side, by default all two-dimensional arrays
+
+    Yields
+    ------
+    pandas.DataFrame
+        Chunk of rows
+    """
+    with zipfile.ZipFile(path) as zf:
+        # Read headers
+        headers = {}
+        for name in zf.namelist():
+            with zf.open(name) as f:
+                headers[name[:-len('.npy')]] = _read_npy_header(f)
+        if keys is None:
+            keys = [k for k, header in headers.items() if len(header[0]) == 2]
+        n_rows = {headers[k][0][0] for k in keys}
+        if len(n_rows) != 1:
+            raise ValueError('arrays must have the same number of rows')
+        if any(headers[k][1] for k in keys):
+            raise ValueError('arrays must be in C order')
+        if columns is None:
+            columns = [
+                k + '_' + str(j+1)
+                for k in keys
+                for j in range(headers[k][0][1])
+            ]
+
+        # Stream rows
+        files = [zf.open(k + '.npy') for k in keys]
+        try:
+            for f in files:
+                _read_npy_header(f)
+            for start in range(0, n_rows.pop(), chunk_size):
+                arrays = []
+                for k, f in zip(keys, files):
+                    (n, n_cols), _, dtype = headers[k]
+                    n_chunk = min(chunk_size, n - start)
+                    buffer = f.read(n_chunk * n_cols * dtype.itemsize)
+                    arrays.append(
+                        np.frombuffer(buffer, dtype=dtype)
+                        .reshape(n_chunk, n_cols)
+                    )
+                yield pd.DataFrame(np.concatenate(arrays, axis=1),
+                                   columns=columns)
+        finally:
+            for f in files:
+                f.close()
+
+
+def _read_npy_header(f):
+    """
+    Read header of npy file, leaving file at start of data
+
+    Parameters
+    ----------
+    f : file
+        Open npy file
+
+    Returns
+    -------
+    tuple
+        Tuple of shape, whether in Fortran order, and dtype
+    """
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)
+    else:
+        return np.lib.format.read_array_header_2_0(f)
+
+
+def hypervolume_contributions(
+    df,
+    objs,
+    reference_point,
+    max_objs=None,
+    method='exact',
+    samples=100000,
+    seed=None,
+):
+    """
+    Get exclusive hypervolume contribution of every row
+
+    Parameters
+    ----------
+    df: DataFrame
+        DataFrame of solutions
+    objs: list
+        List of strings correspond to column names of objectives
+    reference_point : list
+        Reference point for hypervolume calculation in units of objectives
+    max_objs: list (Optional)
+        List of objective to maximize
+    method : str, optional
+        `'exact'` or `'mc'` (Monte Carlo approximation, recommended for
+         many objectives), by default `'exact'`
+    samples : int, optional
+        Number of Monte Carlo samples, by default 100000
+    seed : int, optional
+        Seed of Monte Carlo samples, by default None
+
+    Returns
+    -------
+    pandas.Series
+        Hypervolume contribution of each row
+    """
+    costs, reference_point = _minimization_costs(
+        df,
+        objs,
+        reference_point,
+        max_objs
+    )
+    contributions = postmocot.hypervolume.hypervolume_contributions(
+        costs,
+        reference_point,
+        method=method,
+        samples=samples,
+        seed=seed
+    )
+
+    return pd.Series(
+        contributions,
+        index=df.index,
+        name='hypervolume_contribution'
+    )
+
+
+def select_representative(df, objs, reference_point, k, max_objs=None):
+    """
+    Get subset of rows with largest hypervolume
+
+    Parameters
+    ----------
+    df: DataFrame
+        DataFrame of solutions
+    objs: list
+        List of strings correspond to column names of objectives
+    reference_point : list
+        Reference point for hypervolume calculation in units of objectives
+    k : int
+        Number of rows to select
+    max_objs: list (Optional)
+        List of objective to maximize
+
+    Returns
+    -------
+    df_selected: DataFrame
+        Selected rows in order of selection with `hypervolume_gain` column
+    """
+    costs, reference_point = _minimization_costs(
+        df,
+        objs,
+        reference_point,
+        max_objs
+    )
+    idx, gains = postmocot.hypervolume.greedy_subset(
+        costs,
+        reference_point,
+        k
+    )
+    df_selected = df.iloc[idx].copy()
+    df_selected['hypervolume_gain'] = gains
+
+    return df_selected
+
+
+def _minimization_costs(df, objs, reference_point, max_objs=None):
+    """
+    Objectives and reference point with maximized objectives flipped
+
+    Parameters
+    ----------
+    df: DataFrame
+        DataFrame of solutions
+    objs: list
+        List of strings correspond to column names of objectives
+    reference_point : list
+        Reference point in units of objectives
+    max_objs: list (Optional)
+        List of objective to maximize
+
+    Returns
+    -------
+    tuple
+        Tuple of costs array and reference point array
+    """
+    costs = df[objs].values.astype(float)
+    reference_point = np.array(reference_point, dtype=float)
+    if max_objs is not None:
+        flip = np.isin(objs, max_objs)
+        costs[:, flip] = -costs[:, flip]
+        reference_point[flip] = -reference_point[flip]
+
+    return costs, reference_point
+
+
+class PolicySelector:
+    """
+    Select policies by nearest points in normalized objective space
+    """
+    def __init__(
+        self,
+        runtime: postmocot.runtime.BorgRuntimeDiagnostic,
+        nfe=None,
+    ):
+        """Initilization
+
+        Parameters
+        ----------
+        runtime : postmocot.runtime.BorgRuntimeDiagnostic
+            Runtime object
+        nfe : int, optional
+            Function evaluations of archive, by default final archive
+        """
+        # Build archive
+        if nfe is None:
+            nfe = runtime.nfe[-1]
+        df_objs = pd.DataFrame(
+            runtime.archive_objectives[nfe],
+            columns=runtime.objective_names
+        )
+        df_decs = pd.DataFrame(
+            runtime.archive_decisions[nfe],
+            columns=runtime.decision_names
+        )
+        self.df = pd.concat([df_decs, df_objs], axis=1)
+        self.decision_names = runtime.decision_names
+        self.objective_names = runtime.objective_names
+
+        # Normalize objectives to unit range
+        self.lower = df_objs.min()
+        self.scale = df_objs.max() - self.lower
+        self.scale[self.scale == 0] = 1.0
+        self.df_normalized = (df_objs - self.lower) / self.scale
+
+        # KD-trees keyed by objectives
+        self._trees = {}
+
+    def _tree(self, objs):
+        """KD-tree of normalized objectives
+
+        Parameters
+        ----------
+        objs : list
+            Objective names
+
+        Returns
+        -------
+        scipy.spatial.cKDTree
+            KD-tree of archive
+        """
+        key = tuple(objs)
+        if key not in self._trees:
+            self._trees[key] = cKDTree(self.df_normalized[objs].values)
+
+        return self._trees[key]
+
+    def query(self, targets, k=1):
+        """
+        Find solutions nearest to targets
+
+        Parameters
+        ----------
+        targets : pandas.DataFrame or dict
+            Target objective values with objective names as columns
+        k : int, optional
+            Number of nearest solutions per target, by default 1. At most
+             all solutions are returned
+
+        Returns
+        -------
+        numpy.ndarray
+            An (n_targets, k) array of row positions of nearest solutions
+        """
+        df_targets = pd.DataFrame(targets)
+        objs = df_targets.columns.tolist()
+        normalized = (df_targets - self.lower[objs]) / self.scale[objs]
+        k = min(k, len(self.df))
+        _, idx = self._tree(objs).query(normalized.values, k=k)
+
+        return np.reshape(idx, (len(df_targets), k))
+
+    def select(self, targets, policy_names, policy_col='policy_label', k=1):
+        """
+        Select policies nearest to targets
+
+        Parameters
+        ----------
+        targets : pandas.DataFrame or dict
+            Target objective values with objective names as columns
+        policy_names : list
+            Name of policy of each target
+        policy_col : str, optional
+            Name of policy column, by default 'policy_label'
+        k : int, optional
+            Number of policies per target, by default 1
+
+        Returns
+        -------
+        pandas.DataFrame
+            Selected policy DataFrame
+        """
+        idx = self.query(targets, k=k)
+
+        return self._label(
+            idx.ravel(),
+            np.repeat(policy_names, idx.shape[1]),
+            policy_col
+        )
+
+    def select_ideal(
+        self,
+        policy_name,
+        objs=None,
+        policy_col='policy_label',
+        k=1,
+    ):
+        """
+        Select policies nearest to ideal point
+
+        Parameters
+        ----------
+        policy_name : str
+            Name of policy
+        objs : list, optional
+            Objectives of ideal point, by default all objectives
+        policy_col : str, optional
+            Name of policy column, by default 'policy_label'
+        k : int, optional
+            Number of policies, by default 1
+
+        Returns
+        -------
+        pandas.DataFrame
+            Selected policy DataFrame
+        """
+        if objs is None:
+            objs = self.objective_names
+        targets = self.lower[objs].to_frame().T
+
+        return self.select(targets, [policy_name], policy_col, k)
+
+    def select_neighbors(
+        self,
+        policy_idx,
+        policy_names,
+        objs=None,
+        policy_col='policy_label',
+        k=1,
+    ):
+        """
+        Select policies nearest to given policies
+
+        Parameters
+        ----------
+        policy_idx : list
+            Row positions of given policies
+        policy_names : list
+            Name of neighbors of each given policy
+        objs : list, optional
+            Objectives of distance, by default all objectives
+        policy_col : str, optional
+            Name of policy column, by default 'policy_label'
+        k : int, optional
+            Number of neighbors per policy, by default 1
+
+        Returns
+        -------
+        pandas.DataFrame
+            Selected policy DataFrame
+        """
+        # Nearest solutions other than given policy
+        if objs is None:
+            objs = self.objective_names
+        policy_idx = np.asarray(policy_idx)
+        targets = self.df[objs].iloc[policy_idx]
+        idx = self.query(targets, k=min(k+1, len(self.df)))
+        others = idx != policy_idx[:, None]
+        others[others.sum(axis=1) > k, -1] = False
+        idx = idx[others].reshape(len(policy_idx), -1)
+
+        return self._label(
+            idx.ravel(),
+            np.repeat(policy_names, idx.shape[1]),
+            policy_col
+        )
+
+    def _label(self, idx, policy_names, policy_col):
+        """
+        Labeled decisions of solutions
+
+        Parameters
+        ----------
+        idx : numpy.ndarray
+            Row positions of solutions
+        policy_names : list
+            Name of policy of each solution
+        policy_col : str
+            Name of policy column
+
+        Returns
+        -------
+        pandas.DataFrame
+            Selected policy DataFrame
+        """
+        df = self.df[self.decision_names].iloc[idx].copy()
+        df[policy_col] = policy_names
+
+        return df
+
+
 def select_policies(
     runtime: postmocot.runtime.BorgRuntimeDiagnostic,
     closest_cost: float,
@@ -98,22 +1060,7 @@ def select_policies(
     pandas.DataFrame
         Selected policy DataFrame
     """
-    # Build archive
-    df_objs = pd.DataFrame(
-        runtime.archive_objectives[runtime.nfe[-1]],
-        columns=runtime.objective_names
-    )
-    df_decs = pd.DataFrame(
-        runtime.archive_decisions[runtime.nfe[-1]],
-        columns=runtime.decision_names
-    )
-    df = pd.concat([df_decs, df_objs], axis=1)
-
-    # Extracting policies
-    df[policy_col] = ''
-    idx_compromise = df.iloc[(df[cost_col]-closest_cost).abs().argsort()[:1]].index[0]  # noqa
-    df.at[idx_compromise, policy_col] = policy_name
-    df = df[df[policy_col] != '']
-    df = df[runtime.decision_names + [policy_col]]
+    selector = PolicySelector(runtime)
+    df = selector.select({cost_col: [closest_cost]}, [policy_name], policy_col)
 
     return df
@@ -2,13 +2,23 @@
 
 import pandas as pd
 import numpy as np
-from more_itertools import consecutive_groups
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pygmo
 import paxplot
 import hiplot as hip
 import os
+import hashlib
+import json
+import time
+import mmap
+import gzip
+import bz2
+import lzma
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from collections.abc import Mapping
 import postmocot
 sns.set()
 
@@ -17,110 +27,1102 @@ class BorgRuntimeUtils:
     """
     Borg multi-objective algorithm runtime parsing utilities
     """
-    def _parse_stats(self, df_raw):
+    # Runtime statistics and corresponding attribute names
+    stat_attributes = {
+        'ArchiveSize': 'archive_size',
+        'ElapsedTime': 'elapsed_time',
+        'Improvements': 'improvements',
+        'MutationIndex': 'mutation_index',
+        'PopulationSize': 'population_size',
+        'Restarts': 'restarts',
+        'PCX': 'pcx',
+        'DE': 'de',
+        'SBX': 'sbx',
+        'SPX': 'spx',
+        'UM': 'um',
+        'UNDX': 'undx',
+    }
+
+    def _iter_snapshots(self, path, offset=0, select=None):
         """
-        Convert Borg MOEA runtime file to pandas DataFrame
+        Stream Borg MOEA runtime file one snapshot at a time
+
+        Only the lines of the current snapshot are held in memory. A
+        trailing snapshot that is not terminated by `#` is ignored.
 
         Parameters
         ----------
         path : str
             Path to Borg MOEA runtime file
-        decision_names : list
-            Decision names
-        objective_names : list
-            Objective names
+        offset : int, optional
+            Byte offset to start reading from, by default 0
+        select : callable, optional
+            Function of the statistics dictionary returning whether to parse
+             the snapshot's archive, by default all archives are parsed
+
+        Yields
+        ------
+        tuple
+            Tuple of statistics dictionary, decisions, objectives, and
+             metrics arrays (None if not selected), and byte offset after the
+             snapshot
+        """
+        # Setup
+        stats = {}
+        rows = []
+        selected = None
+
+        with _open_runtime(path) as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Line still being written
+                    break
+                offset += len(line)
+                if line.startswith(b'//'):
+                    # Runtime statistic
+                    name, value = line[2:].split(b'=', 1)
+                    stats[name.decode()] = float(value)
+                    continue
+                if not line.strip():
+                    continue
+
+                # Select snapshot once its statistics are complete
+                if selected is None:
+                    selected = select is None or select(stats)
+
+                if line.startswith(b'#'):
+                    # End of snapshot
+                    if selected:
+                        archive = self._parse_archive(b''.join(rows))
+                    else:
+                        archive = (None, None, None)
+                    yield (stats,) + archive + (offset,)
+                    stats = {}
+                    rows = []
+                    selected = None
+                elif selected:
+                    # Archive row
+                    rows.append(line)
+
+    def _index_snapshots(self, path, offset=0):
+        """
+        Index byte offsets of archive snapshots in Borg MOEA runtime file
+
+        Archive rows are skipped without being decoded. A trailing snapshot
+        that is not terminated by `#` is ignored.
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+        offset : int, optional
+            Byte offset to start reading from, by default 0
+
+        Yields
+        ------
+        tuple
+            Tuple of statistics dictionary, start and end byte offsets of the
+             snapshot's archive rows, and byte offset after the snapshot
+        """
+        # Setup
+        stats = {}
+        start = offset
+
+        with _open_runtime(path) as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Line still being written
+                    break
+                if line.startswith(b'//'):
+                    # Runtime statistic
+                    name, value = line[2:].split(b'=', 1)
+                    stats[name.decode()] = float(value)
+                    start = offset + len(line)
+                elif line.startswith(b'#'):
+                    # End of snapshot
+                    yield stats, start, offset, offset + len(line)
+                    stats = {}
+                offset += len(line)
+
+    def _scan_buffer(self, buf, offset=0):
+        """
+        Find snapshot boundaries in memory-mapped Borg MOEA runtime file
+
+        Snapshots are located by searching the buffer for `//NFE=` and `#`
+        markers. A trailing snapshot that is not terminated by `#` is ignored.
+
+        Parameters
+        ----------
+        buf : mmap.mmap
+            Memory-mapped runtime file
+        offset : int, optional
+            Byte offset to start searching from, by default 0
+
+        Yields
+        ------
+        tuple
+            Tuple of statistics dictionary, start and end byte offsets of the
+             snapshot's archive rows, and byte offset after the snapshot
+        """
+        while True:
+            # Snapshot boundaries
+            pos = buf.find(b'//NFE=', offset)
+            if pos == -1:
+                break
+            end = buf.find(b'\n#', pos) + 1
+            if end == 0:
+                break
+            next_offset = buf.find(b'\n', end) + 1
+            if next_offset == 0:
+                # Line still being written
+                break
+
+            # Runtime statistics
+            stats = {}
+            while buf[pos:pos+2] == b'//':
+                line_end = buf.find(b'\n', pos)
+                name, value = buf[pos+2:line_end].split(b'=', 1)
+                stats[name.decode()] = float(value)
+                pos = line_end + 1
+
+            yield stats, pos, end, next_offset
+            offset = next_offset
+
+    def _map_snapshots(self, path, offset=0, parse=True, select=None):
+        """
+        Read Borg MOEA runtime file through a memory map
+
+        Archive rows are parsed directly from the mapped buffer. Files that
+        cannot be mapped (e.g., empty or compressed files) are streamed
+        instead.
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+        offset : int, optional
+            Byte offset to start reading from, by default 0
+        parse : bool, optional
+            Parse archives, by default True. Otherwise only index them
+        select : callable, optional
+            Function of the statistics dictionary returning whether to parse
+             the snapshot's archive, by default all archives are parsed
+
+        Yields
+        ------
+        tuple
+            Snapshots as yielded by `_iter_snapshots` if parsing, otherwise
+             as yielded by `_index_snapshots`
+        """
+        with open(path, 'rb') as f:
+            buf = None
+            if not _is_compressed(path):
+                try:
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    pass
+
+            # Stream files that cannot be mapped
+            if buf is None:
+                if parse:
+                    yield from self._iter_snapshots(path, offset, select)
+                else:
+                    yield from self._index_snapshots(path, offset)
+                return
+
+            with buf:
+                for stats, start, end, next_offset in self._scan_buffer(
+                    buf,
+                    offset
+                ):
+                    if parse:
+                        if select is None or select(stats):
+                            archive = self._parse_archive(buf[start:end])
+                        else:
+                            archive = (None, None, None)
+                        yield (stats,) + archive + (next_offset,)
+                    else:
+                        yield stats, start, end, next_offset
+
+    def _find_last_snapshot(self, path, chunk_size=2**16):
+        """
+        Find byte offset of last complete snapshot by reading backwards
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+        chunk_size : int, optional
+            Number of bytes read per step, by default 2**16
 
         Returns
         -------
-        pandas.DataFrame
-            Parsed runtime file
+        int
+            Byte offset of first line of last complete snapshot
         """
-        # Omit Population Prints
-        df_res = df_raw[-np.isnan(df_raw['value'])]
+        # Compressed files cannot be read backwards efficiently
+        if _is_compressed(path):
+            offsets = [0, 0] + [
+                next_offset
+                for *_, next_offset in self._index_snapshots(path)
+            ]
+            return offsets[-2]
 
-        # Replace //
-        df_res = pd.DataFrame(
-            [df_res['var'].str.replace('//', ''), df_res['value']]
-        ).T
+        # Setup
+        buf = b''
+        last = -1
+
+        with open(path, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            while pos > 0:
+                # Read preceding chunk
+                n_bytes = min(chunk_size, pos)
+                pos -= n_bytes
+                f.seek(pos)
+                buf = f.read(n_bytes) + buf
+                if last != -1:
+                    last += n_bytes
+
+                # Terminating `#` line of last complete snapshot
+                if last == -1:
+                    idx = buf.rfind(b'\n#')
+                    while idx != -1 and buf.find(b'\n', idx + 1) == -1:
+                        idx = buf.rfind(b'\n#', 0, idx)
+                    if idx != -1:
+                        last = idx + 1
+
+                # Terminating `#` line of previous snapshot
+                if last != -1:
+                    idx = buf.rfind(b'\n#', 0, last - 1)
+                    if idx != -1:
+                        return pos + buf.index(b'\n', idx + 1) + 1
+
+        return 0
+
+    def _parse_archive(self, block):
+        """
+        Convert archive rows to arrays
 
-        # Add index
-        df_res['nfe_index'] = \
-            [i for i in np.arange(0, len(df_res) // 13) for j in range(13)]
+        Parameters
+        ----------
+        block : bytes
+            Space-deliminated archive rows of a single snapshot
 
-        # Parse Data Into Columns
-        df_res = pd.pivot(
-            df_res,
-            columns='var',
-            values='value',
-            index='nfe_index'
-        ).reset_index(drop=True)
+        Returns
+        -------
+        tuple
+            Tuple of decisions, objectives, and metrics arrays
+        """
+        # Convert to single array
+        n_cols = self.n_decisions + self.n_objectives + self.n_metrics
+        archive = np.fromstring(block, sep=' ').reshape(-1, n_cols)
 
-        # Convert to Float
-        df_res = df_res.astype(float)
+        # Extract decisions, objectives, metrics from archive
+        start_idx = 0
+        end_idx = self.n_decisions
+        decisions = archive[:, start_idx:end_idx]
+        start_idx = end_idx
+        end_idx = start_idx + self.n_objectives
+        objectives = archive[:, start_idx:end_idx]
+        start_idx = end_idx
+        end_idx = start_idx + self.n_metrics
+        metrics = archive[:, start_idx:end_idx]
 
-        df_res.index = df_res['NFE'].astype(int)
+        return decisions, objectives, metrics
 
-        return df_res
+    def _append_stats(self, stats):
+        """
+        Store runtime statistics of snapshot in runtime attributes
 
-    def _parse_archive(
-        self,
-        df,
-        n_decisions,
-        n_objectives,
-        n_metrics
-    ):
+        Parameters
+        ----------
+        stats : dict
+            Runtime statistics of snapshot
+
+        Returns
+        -------
+        int
+            Number of function evaluations of snapshot
+        """
+        nfe = int(stats['NFE'])
+        self.nfe.append(nfe)
+        for stat_name, attr_name in self.stat_attributes.items():
+            getattr(self, attr_name)[nfe] = stats[stat_name]
+
+        return nfe
+
+    def _append_snapshot(self, stats, decisions, objectives, metrics):
+        """
+        Store parsed snapshot in runtime attributes
+
+        Parameters
+        ----------
+        stats : dict
+            Runtime statistics of snapshot
+        decisions : numpy.ndarray
+            Archive decisions
+        objectives : numpy.ndarray
+            Archive objectives
+        metrics : numpy.ndarray
+            Archive metrics
+        """
+        nfe = self._append_stats(stats)
+        self.archive_store.append(nfe, decisions, objectives, metrics)
+
+    def _hash_file(self, path):
+        """
+        Hash contents of runtime file
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+
+        Returns
+        -------
+        str
+            SHA-1 hex digest of file contents
+        """
+        sha = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(2**20), b''):
+                sha.update(chunk)
+
+        return sha.hexdigest()
+
+    def _write_cache(self, path):
+        """
+        Write parsed runtime to binary sidecar next to runtime file
+
+        Archives are stored as contiguous arrays with offsets marking the rows
+        of each snapshot. The sidecar is keyed by the size, modification time,
+        and hash of the runtime file.
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+
+        Returns
+        -------
+        bool
+            Whether sidecar was written
+        """
+        # Setup
+        stat = os.stat(path)
+        path_to_cache = path + '.npz'
+        store = self.archive_store
+
+        # Save to unique temporary file then move to avoid partial sidecars
+        path_to_temp = None
+        try:
+            fd, path_to_temp = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(path_to_cache)),
+                suffix='.npz'
+            )
+            os.close(fd)
+            np.savez(
+                path_to_temp,
+                source_size=stat.st_size,
+                source_mtime=stat.st_mtime_ns,
+                source_hash=self._hash_file(path),
+                offset=self.offset,
+                shape=[self.n_decisions, self.n_objectives, self.n_metrics],
+                nfe=np.array(self.nfe, dtype=int),
+                stat_names=list(self.stat_attributes),
+                stats=np.array([
+                    [getattr(self, attr_name)[nfe] for nfe in self.nfe]
+                    for attr_name in self.stat_attributes.values()
+                ]).reshape(len(self.stat_attributes), len(self.nfe)),
+                decisions=store.decisions,
+                objectives=store.objectives,
+                metrics=store.metrics,
+                offsets=store.offsets,
+            )
+            os.replace(path_to_temp, path_to_cache)
+        except OSError:
+            # Cache is optional (e.g., read-only directory)
+            if path_to_temp is not None and os.path.exists(path_to_temp):
+                os.remove(path_to_temp)
+            return False
+
+        return True
+
+    def _read_cache(self, path):
+        """
+        Load parsed runtime from binary sidecar if it matches runtime file
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg MOEA runtime file
+
+        Returns
+        -------
+        bool
+            Whether runtime was loaded from sidecar
         """
-        Convert archive data to dataframes
+        # Check sidecar
+        path_to_cache = path + '.npz'
+        if not os.path.exists(path_to_cache):
+            return False
+        stat = os.stat(path)
+        try:
+            with np.load(path_to_cache) as cache:
+                # Check shape and source
+                shape = [self.n_decisions, self.n_objectives, self.n_metrics]
+                if 'decisions' not in cache.files:
+                    return False
+                if cache['shape'].tolist() != shape:
+                    return False
+                if cache['source_size'] != stat.st_size:
+                    return False
+                if cache['source_mtime'] != stat.st_mtime_ns:
+                    # Modified time alone is not trusted (e.g., copied files)
+                    if cache['source_hash'] != self._hash_file(path):
+                        return False
+                data = {k: cache[k] for k in cache.files}
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Unreadable sidecar (e.g., corrupt or truncated) is a miss
+            return False
+
+        # Runtime statistics
+        self.offset = int(data['offset'])
+        nfe = data['nfe'].tolist()
+        self.nfe = nfe
+        for stat_name, values in zip(data['stat_names'], data['stats']):
+            attr_name = self.stat_attributes[stat_name]
+            setattr(self, attr_name, dict(zip(nfe, values.tolist())))
+
+        # Archives
+        self.archive_store.extend(
+            nfe,
+            data['decisions'],
+            data['objectives'],
+            data['metrics'],
+            data['offsets']
+        )
+
+        return True
+
+
+class BorgArchiveStore:
+    """
+    Archive snapshots stored in contiguous arrays
+    """
+    def __init__(self, n_decisions, n_objectives, n_metrics):
+        """
+        Initilization
+
+        Snapshots are stacked row-wise into one array each for decisions,
+        objectives, and metrics. `offsets` marks the rows of each snapshot
+        (i.e., snapshot `i` spans rows `offsets[i]` to `offsets[i+1]`).
+        Arrays are preallocated and their capacity doubled when full, so
+        appending costs time proportional to the appended rows.
 
         Parameters
         ----------
-        df : pandas.DataFrame
-            Raw runtime pandas dataframe
         n_decisions : int
             Number of decisions
         n_objectives : int
             Number of objectives
         n_metrics : int
             Number of metrics
+        """
+        self.nfe = []
+        self._decisions = np.empty((0, n_decisions))
+        self._objectives = np.empty((0, n_objectives))
+        self._metrics = np.empty((0, n_metrics))
+        self._offsets = np.zeros(1, dtype=int)
+        self._rows = {}
+        self._n_rows = 0
+
+    @property
+    def decisions(self):
+        return self._decisions[:self._n_rows]
+
+    @property
+    def objectives(self):
+        return self._objectives[:self._n_rows]
+
+    @property
+    def metrics(self):
+        return self._metrics[:self._n_rows]
+
+    @property
+    def offsets(self):
+        return self._offsets[:len(self.nfe)+1]
+
+    def __contains__(self, nfe):
+        return nfe in self._rows
+
+    def __iter__(self):
+        return iter(self.nfe)
+
+    def __len__(self):
+        return len(self.nfe)
+
+    def append(self, nfe, decisions, objectives, metrics):
+        """
+        Append snapshot
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
+        decisions : numpy.ndarray
+            Archive decisions
+        objectives : numpy.ndarray
+            Archive objectives
+        metrics : numpy.ndarray
+            Archive metrics
+        """
+        self.extend(
+            [nfe],
+            decisions,
+            objectives,
+            metrics,
+            np.array([0, len(objectives)])
+        )
+
+    def extend(self, nfe, decisions, objectives, metrics, offsets):
+        """
+        Append stacked snapshots
+
+        Parameters
+        ----------
+        nfe : list
+            Number of function evaluations of snapshots
+        decisions : numpy.ndarray
+            Stacked archive decisions
+        objectives : numpy.ndarray
+            Stacked archive objectives
+        metrics : numpy.ndarray
+            Stacked archive metrics
+        offsets : numpy.ndarray
+            First row of each snapshot and total number of rows
+        """
+        # Setup
+        n_snapshots = len(self.nfe)
+        start = self._n_rows
+        end = start + len(objectives)
+        self._reserve(end, n_snapshots + len(nfe) + 1)
+
+        # Copy into free capacity
+        self._decisions[start:end] = decisions
+        self._objectives[start:end] = objectives
+        self._metrics[start:end] = metrics
+        self._offsets[n_snapshots+1:n_snapshots+len(nfe)+1] = \
+            start + np.asarray(offsets[1:])
+        self._rows.update({j: n_snapshots + i for i, j in enumerate(nfe)})
+        self.nfe.extend(nfe)
+        self._n_rows = end
+
+    def _reserve(self, n_rows, n_offsets):
+        """
+        Grow capacity of arrays to at least the given size
+
+        Parameters
+        ----------
+        n_rows : int
+            Number of rows of decisions, objectives, and metrics
+        n_offsets : int
+            Number of offsets
+        """
+        if n_rows > len(self._objectives):
+            capacity = max(n_rows, 2 * len(self._objectives))
+            for name in ['_decisions', '_objectives', '_metrics']:
+                old = getattr(self, name)
+                new = np.empty((capacity, old.shape[1]))
+                new[:self._n_rows] = old[:self._n_rows]
+                setattr(self, name, new)
+        if n_offsets > len(self._offsets):
+            capacity = max(n_offsets, 2 * len(self._offsets))
+            new = np.zeros(capacity, dtype=int)
+            new[:len(self.nfe)+1] = self._offsets[:len(self.nfe)+1]
+            self._offsets = new
+
+    def snapshot(self, nfe):
+        """
+        Get views of archive snapshot
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
 
         Returns
         -------
         tuple
-            Tuple of decisions, objectives, and metrics list of lists
+            Tuple of decisions, objectives, and metrics arrays
         """
-        # Extract Archive Prints
-        df_temp = df[np.isnan(df['value'])]
-        df_temp = df_temp[df_temp['var'] != '#']
+        i = self._rows[nfe]
+        start, end = self._offsets[i], self._offsets[i+1]
 
-        # Separate Based on Deliminators
-        df_temp = df_temp['var'].str.split(' ', expand=True).astype(float)
+        return (
+            self._decisions[start:end],
+            self._objectives[start:end],
+            self._metrics[start:end]
+        )
 
-        # Extract decisions, objectives, metrics from archive
-        start_idx = 0
-        end_idx = n_decisions
-        df_all_decisions = df_temp.iloc[:, start_idx:end_idx]
-        start_idx = end_idx
-        end_idx = start_idx + n_objectives
-        df_all_objectives = df_temp.iloc[:, start_idx:end_idx]
-        start_idx = end_idx
-        end_idx = start_idx + n_metrics
-        df_all_metrics = df_temp.iloc[:, start_idx:end_idx]
 
-        # Turn into list of lists
-        decisions_ls = [
-            df_all_decisions.loc[i].values.tolist()
-            for i in consecutive_groups(df_all_decisions.index)
-        ]
-        objectives_ls = [
-            df_all_objectives.loc[i].values.tolist()
-            for i in consecutive_groups(df_all_objectives.index)
-        ]
-        metrics_ls = [
-            df_all_metrics.loc[i].values.tolist()
-            for i in consecutive_groups(df_all_metrics.index)
-        ]
+class BorgArchiveIndex:
+    """
+    Lazily decoded archive snapshots of a Borg runtime file
+    """
+    def __init__(self, path, parser, max_cached=8):
+        """
+        Initilization
+
+        Parameters
+        ----------
+        path : str
+            Path to Borg runtime file
+        parser : callable
+            Function converting bytes of archive rows to tuple of decisions,
+             objectives, and metrics arrays
+        max_cached : int, optional
+            Number of recently decoded snapshots to keep, by default 8
+        """
+        self.path = path
+        self.parser = parser
+        self.max_cached = max_cached
+        self.offsets = {}
+        self._cached = OrderedDict()
+
+    def add(self, nfe, start, end):
+        """
+        Add snapshot to index
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
+        start : int
+            Byte offset of first archive row
+        end : int
+            Byte offset after last archive row
+        """
+        self.offsets[nfe] = (start, end)
+
+    def __contains__(self, nfe):
+        return nfe in self.offsets
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def snapshot(self, nfe):
+        """
+        Decode archive snapshot
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
+
+        Returns
+        -------
+        tuple
+            Tuple of decisions, objectives, and metrics arrays
+        """
+        # Recently decoded
+        if nfe in self._cached:
+            self._cached.move_to_end(nfe)
+            return self._cached[nfe]
+
+        # Decode from runtime file
+        start, end = self.offsets[nfe]
+        with _open_runtime(self.path) as f:
+            f.seek(start)
+            snapshot = self.parser(f.read(end - start))
+
+        # Least recently used
+        self._cached[nfe] = snapshot
+        if len(self._cached) > self.max_cached:
+            self._cached.popitem(last=False)
+
+        return snapshot
+
+
+class BorgArchiveView(Mapping):
+    """
+    Read-only mapping of function evaluations to one part of the archive
+    """
+    def __init__(self, source, part):
+        """
+        Initilization
+
+        Parameters
+        ----------
+        source : BorgArchiveStore or BorgArchiveIndex
+            Source of archive snapshots
+        part : int
+            Index of decisions (0), objectives (1), or metrics (2)
+        """
+        self.source = source
+        self.part = part
+
+    def __getitem__(self, nfe):
+        if nfe not in self.source:
+            raise KeyError(nfe)
+        return self.source.snapshot(nfe)[self.part]
+
+    def __iter__(self):
+        return iter(self.source)
+
+    def __len__(self):
+        return len(self.source)
+
+
+class SolutionLineage:
+    """
+    Identity of solutions across archive snapshots
+    """
+    def __init__(self, nfe, decisions, offsets, decimals=10):
+        """
+        Initilization
+
+        Solutions are identified by their decisions rounded to `decimals`,
+        so the same solution has the same id in every snapshot.
 
-        return decisions_ls, objectives_ls, metrics_ls
+        Parameters
+        ----------
+        nfe : list
+            Number of function evaluations of snapshots in increasing order
+        decisions : numpy.ndarray
+            Stacked archive decisions of snapshots
+        offsets : numpy.ndarray
+            First row of each snapshot and total number of rows
+        decimals : int, optional
+            Decimals of decisions identifying a solution, by default 10
+        """
+        # Setup
+        self.nfe = np.asarray(nfe)
+        self.offsets = np.asarray(offsets)
+        self.decimals = decimals
+        n_snapshots = len(self.nfe)
+
+        # Id of each row
+        unique_rows, first_row, row_ids = np.unique(
+            postmocot.process._row_keys(np.round(decisions, decimals)),
+            return_index=True,
+            return_inverse=True
+        )
+        self.row_ids = row_ids.reshape(-1)
+        self.decisions = decisions[first_row]
+        self.n_solutions = len(first_row)
+        self._unique_rows = unique_rows
+
+        # Snapshots containing each solution (sorted by snapshot then id)
+        snapshot = np.repeat(np.arange(n_snapshots), np.diff(self.offsets))
+        keys = np.unique(snapshot * self.n_solutions + self.row_ids)
+        key_snapshot = keys // self.n_solutions
+        key_id = keys % self.n_solutions
+
+        # First and last snapshot of each solution
+        _, first = np.unique(key_id, return_index=True)
+        _, last = np.unique(key_id[::-1], return_index=True)
+        self.first_snapshot = key_snapshot[first]
+        self.last_snapshot = key_snapshot[len(keys) - 1 - last]
+        self.n_snapshots = np.bincount(key_id, minlength=self.n_solutions)
+
+        # Solutions added since previous and removed before next snapshot
+        in_previous = _sorted_isin(keys - self.n_solutions, keys)
+        in_next = _sorted_isin(keys + self.n_solutions, keys)
+        self.added = np.bincount(
+            key_snapshot[~in_previous],
+            minlength=n_snapshots
+        )
+        removed = ~in_next & (key_snapshot < n_snapshots - 1)
+        self.removed = np.bincount(
+            key_snapshot[removed] + 1,
+            minlength=n_snapshots
+        )[:n_snapshots]
+        self.size = np.bincount(key_snapshot, minlength=n_snapshots)
+
+    def ids(self, nfe):
+        """
+        Solution ids of archive rows of snapshot
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
+
+        Returns
+        -------
+        numpy.ndarray
+            Solution id of each archive row
+        """
+        i = np.searchsorted(self.nfe, nfe)
+        if i == len(self.nfe) or self.nfe[i] != nfe:
+            raise KeyError(nfe)
+
+        return self.row_ids[self.offsets[i]:self.offsets[i+1]]
+
+    def lookup(self, decisions):
+        """
+        Solution ids of decisions
+
+        Parameters
+        ----------
+        decisions : numpy.ndarray
+            An (n_points, n_decisions) array of decisions
+
+        Returns
+        -------
+        numpy.ndarray
+            Solution id of each point, -1 if never in archive
+        """
+        rows = postmocot.process._row_keys(np.round(
+            np.atleast_2d(decisions).astype(float),
+            self.decimals
+        ))
+        found = _sorted_isin(rows, self._unique_rows)
+        idx = np.searchsorted(self._unique_rows, rows)
+
+        return np.where(found, idx, -1)
+
+    def entry_nfe(self, ids=None):
+        """
+        Function evaluations of snapshot where solutions entered archive
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, optional
+            Solution ids, by default all solutions
+
+        Returns
+        -------
+        numpy.ndarray
+            Entry NFE of each solution
+        """
+        if ids is None:
+            ids = slice(None)
+
+        return self.nfe[self.first_snapshot[ids]]
+
+    def exit_nfe(self, ids=None):
+        """
+        Function evaluations of first snapshot without solutions after their
+        last appearance
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, optional
+            Solution ids, by default all solutions
+
+        Returns
+        -------
+        numpy.ndarray
+            Exit NFE of each solution, NaN if in final snapshot
+        """
+        if ids is None:
+            ids = slice(None)
+        nfe = np.append(self.nfe, np.nan)
+
+        return nfe[self.last_snapshot[ids] + 1]
+
+    def survival(self, ids=None):
+        """
+        Function evaluations solutions stayed in archive
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, optional
+            Solution ids, by default all solutions
+
+        Returns
+        -------
+        numpy.ndarray
+            Exit NFE (or final NFE if in final snapshot) minus entry NFE of
+             each solution
+        """
+        exit_nfe = self.exit_nfe(ids)
+        exit_nfe = np.where(np.isnan(exit_nfe), self.nfe[-1], exit_nfe)
+
+        return exit_nfe - self.entry_nfe(ids)
+
+    def churn(self):
+        """
+        Solutions added and removed at each snapshot
+
+        Returns
+        -------
+        pandas.DataFrame
+            Number of solutions added since and removed from previous
+             snapshot and archive size, indexed by NFE
+        """
+        df = pd.DataFrame(
+            {
+                'added': self.added,
+                'removed': self.removed,
+                'size': self.size,
+            },
+            index=pd.Index(self.nfe, name='nfe')
+        )
+
+        return df
+
+    def to_frame(self, decision_names=None):
+        """
+        Lineage of every solution
+
+        Parameters
+        ----------
+        decision_names : list, optional
+            Decision names, by default `decision_<number>`
+
+        Returns
+        -------
+        pandas.DataFrame
+            Decisions, entry NFE, exit NFE, survival, and number of snapshots
+             of each solution, indexed by solution id
+        """
+        if decision_names is None:
+            decision_names = [
+                'decision_' + str(i+1) for i in range(self.decisions.shape[1])
+            ]
+        df = pd.DataFrame(self.decisions, columns=decision_names)
+        df['entry_nfe'] = self.entry_nfe()
+        df['exit_nfe'] = self.exit_nfe()
+        df['survival'] = self.survival()
+        df['n_snapshots'] = self.n_snapshots
+        df.index.name = 'solution_id'
+
+        return df
+
+
+class BorgDeltaArchive:
+    """
+    Archive history stored as differences between snapshots
+    """
+    def __init__(self, path_to_delta):
+        """
+        Initilization
+
+        Reads a file written by `write_delta_archive`. Each distinct archive
+        row is stored once. Each snapshot stores the ids of rows removed from
+        and added to the previous snapshot, except for keyframes which store
+        the ids of all rows.
+
+        Parameters
+        ----------
+        path_to_delta : str
+            Path to delta archive file
+        """
+        with np.load(path_to_delta) as data:
+            data = {k: data[k] for k in data.files}
+
+        # Setup
+        self.n_decisions, self.n_objectives, self.n_metrics = \
+            data['shape'].tolist()
+        self.rows = data['rows']
+        self.nfe = data['nfe'].tolist()
+        self._snapshots = {nfe: i for i, nfe in enumerate(self.nfe)}
+        self._added = (data['added'], data['added_offsets'])
+        self._removed = (data['removed'], data['removed_offsets'])
+        self._keyframes = (data['keyframe_ids'], data['keyframe_offsets'])
+        self._is_keyframe = data['is_keyframe']
+
+        # Runtime statistics
+        for stat_name, values in zip(data['stat_names'], data['stats']):
+            attr_name = BorgRuntimeUtils.stat_attributes[stat_name]
+            setattr(self, attr_name, dict(zip(self.nfe, values.tolist())))
+
+    def _ids(self, i, ids):
+        """
+        Row ids of snapshot from row ids of previous snapshot
+
+        Parameters
+        ----------
+        i : int
+            Index of snapshot
+        ids : numpy.ndarray
+            Row ids of previous snapshot
+
+        Returns
+        -------
+        numpy.ndarray
+            Row ids of snapshot
+        """
+        if self._is_keyframe[i]:
+            values, offsets = self._keyframes
+            return values[offsets[i]:offsets[i+1]]
+        values, offsets = self._removed
+        removed = values[offsets[i]:offsets[i+1]]
+        values, offsets = self._added
+        added = values[offsets[i]:offsets[i+1]]
+        if len(removed):
+            ids = ids[~np.isin(ids, removed)]
+
+        return np.concatenate([ids, added])
+
+    def _split(self, ids):
+        """
+        Decisions, objectives, and metrics of rows
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Row ids
+
+        Returns
+        -------
+        tuple
+            Tuple of decisions, objectives, and metrics arrays
+        """
+        archive = self.rows[ids]
+        end_decisions = self.n_decisions
+        end_objectives = end_decisions + self.n_objectives
+
+        return (
+            archive[:, :end_decisions],
+            archive[:, end_decisions:end_objectives],
+            archive[:, end_objectives:]
+        )
+
+    def replay(self):
+        """
+        Reconstruct snapshots in order
+
+        Yields
+        ------
+        tuple
+            Tuple of NFE and decisions, objectives, and metrics arrays of
+             snapshot
+        """
+        ids = np.empty(0, dtype=int)
+        for i, nfe in enumerate(self.nfe):
+            ids = self._ids(i, ids)
+            yield (nfe,) + self._split(ids)
+
+    def archive(self, nfe):
+        """
+        Reconstruct snapshot from the previous keyframe
+
+        Parameters
+        ----------
+        nfe : int
+            Number of function evaluations of snapshot
+
+        Returns
+        -------
+        tuple
+            Tuple of decisions, objectives, and metrics arrays
+        """
+        i = self._snapshots[nfe]
+        start = np.flatnonzero(self._is_keyframe[:i+1])[-1]
+        ids = None
+        for j in range(start, i + 1):
+            ids = self._ids(j, ids)
+
+        return self._split(ids)
 
 
 class BorgRuntimeDiagnostic(BorgRuntimeUtils):
@@ -133,6 +1135,12 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         n_decisions,
         n_objectives,
         n_metrics,
+        cache=True,
+        lazy=False,
+        snapshots='all',
+        nfe_range=None,
+        stride=1,
+        n_snapshots=None,
     ):
         """
         Parsing runtime file and assigning parameters
@@ -140,24 +1148,38 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         Parameters
         ----------
         path_to_runtime : str
-            Path to Borg runtime file
-        decision_names : list
-            List of decision names
-        objective_names : list
-            List of objective names
-        df_metrics : pandas.DataFrame
-            Dataframe of decisions and corresponding metrics
+            Path to Borg runtime file, optionally compressed (`.gz`, `.bz2`,
+             or `.xz`)
+        n_decisions : int
+            Number of decisions
+        n_objectives : int
+            Number of objectives
+        n_metrics : int
+            Number of metrics
+        cache : bool, optional
+            Load from and write to binary sidecar (`<path_to_runtime>.npz`),
+             by default True. Sidecar is ignored if runtime file has changed
+        lazy : bool, optional
+            Only index archive snapshots and decode them when accessed, by
+             default False. Sidecar is not used for lazy runtimes
+        snapshots : str, optional
+            Parse `'all'` snapshots or only the `'last'` snapshot, by default
+             `'all'`. The last snapshot is found by reading backwards from the
+             end of the file. Sidecar is not used for the last snapshot
+        nfe_range : tuple, optional
+            Inclusive range of function evaluations of snapshots to load, by
+             default all snapshots
+        stride : int, optional
+            Load every `stride`-th snapshot, by default 1
+        n_snapshots : int, optional
+            Target number of snapshots to load, sets `stride` accordingly.
+             Archives of snapshots that are not loaded are never decoded and
+             the sidecar is not used when selecting snapshots
         """
         super().__init__()
 
-        # Read input file
-        df_raw = pd.read_table(
-            path_to_runtime,
-            names=['var', 'value'],
-            sep="="
-        )
-
         # General attributes
+        self.path_to_runtime = path_to_runtime
         self.n_decisions = n_decisions
         self.n_objectives = n_objectives
         self.n_metrics = n_metrics
@@ -174,33 +1196,166 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         ]
 
         # Runtime statistics
-        df_res = self._parse_stats(
-            df_raw
-        )
-        self.nfe = df_res.index.to_list()
-        self.archive_size = df_res['ArchiveSize'].to_dict()
-        self.elapsed_time = df_res['ElapsedTime'].to_dict()
-        self.improvements = df_res['Improvements'].to_dict()
-        self.mutation_index = df_res['MutationIndex'].to_dict()
-        self.population_size = df_res['PopulationSize'].to_dict()
-        self.restarts = df_res['Restarts'].to_dict()
-        self.pcx = df_res['PCX'].to_dict()
-        self.de = df_res['DE'].to_dict()
-        self.sbx = df_res['SBX'].to_dict()
-        self.spx = df_res['SPX'].to_dict()
-        self.um = df_res['UM'].to_dict()
-        self.undx = df_res['UNDX'].to_dict()
-
-        # Parsing archives
-        decisions_ls, objectives_ls, metrics_ls = self._parse_archive(
-            df_raw,
-            self.n_decisions,
-            self.n_objectives,
-            self.n_metrics
-        )
-        self.archive_decisions = dict(zip(self.nfe, decisions_ls))
-        self.archive_objectives = dict(zip(self.nfe, objectives_ls))
-        self.archive_metrics = dict(zip(self.nfe, metrics_ls))
+        self.offset = 0
+        self.nfe = []
+        for attr_name in self.stat_attributes.values():
+            setattr(self, attr_name, {})
+
+        # Archives
+        if lazy:
+            # Index archives for decoding on access
+            self._index = BorgArchiveIndex(
+                path_to_runtime,
+                self._parse_archive
+            )
+            source = self._index
+        else:
+            self.archive_store = BorgArchiveStore(
+                n_decisions,
+                n_objectives,
+                n_metrics
+            )
+            source = self.archive_store
+        self.archive_decisions = BorgArchiveView(source, 0)
+        self.archive_objectives = BorgArchiveView(source, 1)
+        self.archive_metrics = BorgArchiveView(source, 2)
+
+        # Snapshot selection
+        if stride < 1:
+            raise ValueError('stride must be positive, got {}'.format(stride))
+        if n_snapshots is not None and n_snapshots < 1:
+            raise ValueError(
+                'n_snapshots must be positive, got {}'.format(n_snapshots)
+            )
+        self.nfe_range = nfe_range
+        self.stride = stride
+        self._n_in_range = 0
+        if nfe_range is not None or stride != 1 or n_snapshots is not None:
+            cache = False
+        if n_snapshots is not None:
+            if stride != 1:
+                raise ValueError('Specify either stride or n_snapshots')
+            n_in_range = sum(
+                self._in_nfe_range(stats)
+                for stats, *_ in self._map_snapshots(
+                    path_to_runtime,
+                    parse=False
+                )
+            )
+            self.stride = max(1, -(-n_in_range // n_snapshots))
+
+        # Skip to final archive
+        if snapshots == 'last':
+            cache = False
+            self.offset = self._find_last_snapshot(path_to_runtime)
+        elif snapshots != 'all':
+            raise ValueError(
+                'snapshots must be `all` or `last`, got {}'.format(snapshots)
+            )
+
+        # Load from sidecar or parse runtime file in a single pass
+        self.cached = False
+        if lazy:
+            self.refresh()
+        elif cache and self._read_cache(path_to_runtime):
+            self.cached = True
+        else:
+            self.refresh()
+            if cache:
+                self.cached = self._write_cache(path_to_runtime)
+
+    def _in_nfe_range(self, stats):
+        """
+        Check whether snapshot is within range of function evaluations
+
+        Parameters
+        ----------
+        stats : dict
+            Runtime statistics of snapshot
+
+        Returns
+        -------
+        bool
+            Whether snapshot is in range
+        """
+        if self.nfe_range is None:
+            return True
+        start, stop = self.nfe_range
+
+        return start <= stats['NFE'] <= stop
+
+    def _select_snapshot(self, stats):
+        """
+        Check whether snapshot is selected by range and stride
+
+        Parameters
+        ----------
+        stats : dict
+            Runtime statistics of snapshot
+
+        Returns
+        -------
+        bool
+            Whether snapshot is selected
+        """
+        if not self._in_nfe_range(stats):
+            return False
+        self._n_in_range += 1
+
+        return (self._n_in_range - 1) % self.stride == 0
+
+    def refresh(self):
+        """
+        Parse snapshots appended to runtime file since it was last parsed
+
+        Only complete snapshots are parsed, so this can be called repeatedly
+        on the runtime file of an optimization that is still running.
+        Computed hypervolumes and indicators are extended to new snapshots
+        only (previous snapshots are not recomputed).
+
+        Returns
+        -------
+        list
+            Function evaluations of new snapshots
+        """
+        # Setup
+        n_parsed = len(self.nfe)
+        size = os.path.getsize(self.path_to_runtime)
+        if not _is_compressed(self.path_to_runtime) and size < self.offset:
+            raise ValueError(
+                'Runtime file {} was truncated'.format(self.path_to_runtime)
+            )
+
+        # Parse new snapshots
+        if hasattr(self, '_index'):
+            for stats, start, end, offset in self._map_snapshots(
+                self.path_to_runtime,
+                self.offset,
+                parse=False
+            ):
+                if self._select_snapshot(stats):
+                    self._index.add(self._append_stats(stats), start, end)
+                self.offset = offset
+        else:
+            for stats, *archive, offset in self._map_snapshots(
+                self.path_to_runtime,
+                self.offset,
+                select=self._select_snapshot
+            ):
+                if archive[0] is not None:
+                    self._append_snapshot(stats, *archive)
+                self.offset = offset
+        new_nfe = self.nfe[n_parsed:]
+
+        # Update hypervolume and indicators
+        if hasattr(self, 'hypervolume') and new_nfe:
+            self._extend_hypervolume(new_nfe)
+        if hasattr(self, '_indicator_args') and new_nfe:
+            self._extend_indicators(new_nfe)
+        if hasattr(self, 'lineage') and new_nfe:
+            self.build_lineage(self.lineage.decimals)
+
+        return new_nfe
 
     def set_decision_names(self, decision_names):
         """Set decision names
@@ -232,27 +1387,173 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         """
         self.metric_names = metric_names
 
-    def compute_hypervolume(self, reference_point):
-        """Compute hypervolumes
+    def compute_hypervolume(
+        self,
+        reference_point,
+        method='exact',
+        workers=1,
+        memoize=True,
+        samples=100000,
+        seed=None,
+        confidence=0.95,
+    ):
+        """Compute hypervolumes
+
+        Parameters
+        ----------
+        reference_point : list
+            Reference point for hypervolume calculation. Length must be same
+             as objectives
+        method : str, optional
+            `'exact'` computes each snapshot from scratch. `'incremental'`
+             updates the previous snapshot's hypervolume by the contributions
+             of added and removed points, falling back to exact computation
+             for up to three objectives or many changed points. `'mc'`
+             estimates the hypervolume by Monte Carlo sampling and stores
+             confidence intervals in `hypervolume_ci`. By default `'exact'`
+        workers : int, optional
+            Number of processes to spread snapshots across, by default 1
+        memoize : bool, optional
+            Reuse hypervolumes of previously seen archives from memory and
+             from `<path_to_runtime>.hv.json`, by default True
+        samples : int, optional
+            Number of Monte Carlo samples per snapshot, by default 100000
+        seed : int, optional
+            Seed of Monte Carlo samples, by default None
+        confidence : float, optional
+            Level of Monte Carlo confidence interval, by default 0.95
+        """
+        # Setup
+        if method not in ['exact', 'incremental', 'mc']:
+            raise ValueError(
+                'method must be `exact`, `incremental`, or `mc`, got {}'
+                .format(method)
+            )
+        self._hypervolume_args = (
+            reference_point,
+            method,
+            workers,
+            memoize,
+            samples,
+            seed,
+            confidence
+        )
+        self.hypervolume = {}
+        if method == 'mc':
+            self.hypervolume_ci = {}
+        else:
+            self.hypervolume_ci = None
+
+        # Compute hypervolume
+        self._extend_hypervolume(list(self.archive_objectives))
+
+    def _extend_hypervolume(self, nfe):
+        """Compute hypervolumes of additional snapshots
+
+        Parameters
+        ----------
+        nfe : list
+            Function evaluations of snapshots
+        """
+        # Setup
+        reference_point, method, workers, memoize, samples, seed, \
+            confidence = self._hypervolume_args
+        if memoize:
+            path_to_cache = self.path_to_runtime + '.hv.json'
+        else:
+            path_to_cache = None
+
+        # Compute hypervolume
+        hypervolumes = postmocot.hypervolume.compute_hypervolumes(
+            [self.archive_objectives[i] for i in nfe],
+            reference_point,
+            method=method,
+            workers=workers,
+            memoize=memoize,
+            path_to_cache=path_to_cache,
+            samples=samples,
+            seed=seed,
+            confidence=confidence
+        )
+
+        # Store values
+        if method == 'mc':
+            self.hypervolume.update(
+                {i: j[0] for i, j in zip(nfe, hypervolumes)}
+            )
+            self.hypervolume_ci.update(
+                {i: j[1:] for i, j in zip(nfe, hypervolumes)}
+            )
+        else:
+            self.hypervolume.update(zip(nfe, hypervolumes))
+
+    def compute_indicators(self, reference_set, normalize=False):
+        """Compute quality indicators of each snapshot
+
+        Generational distance, inverted generational distance, additive
+        epsilon, and spacing are stored in the `generational_distance`,
+        `inverted_generational_distance`, `additive_epsilon`, and `spacing`
+        attributes keyed by NFE.
+
+        Parameters
+        ----------
+        reference_set : numpy.ndarray
+            An (n_reference, n_objectives) array of reference objectives
+        normalize : bool, optional
+            Scale objectives to the range of the reference set before
+             computing, by default False
+        """
+        # Setup
+        self._indicator_args = (reference_set, normalize)
+        for name in postmocot.indicators.INDICATORS:
+            setattr(self, name, {})
+
+        # Compute indicators
+        self._extend_indicators(list(self.archive_objectives))
+
+    def _extend_indicators(self, nfe):
+        """Compute quality indicators of additional snapshots
+
+        Parameters
+        ----------
+        nfe : list
+            Function evaluations of snapshots
+        """
+        values = postmocot.indicators.compute_indicators(
+            [self.archive_objectives[i] for i in nfe],
+            *self._indicator_args
+        )
+        for name, value in values.items():
+            getattr(self, name).update(zip(nfe, value))
+
+    def build_lineage(self, decimals=10):
+        """Index identity of solutions across snapshots
 
         Parameters
         ----------
-        reference_point : list
-            Reference point for hypervolume calculation. Length must be same
-             as objectives
-        """
-        # Setup
-        hypervolume_dict = {}
+        decimals : int, optional
+            Decimals of decisions identifying a solution, by default 10
 
-        for nfe, objs in self.archive_objectives.items():
-            # Compute hypervolume
-            hv = pygmo.hypervolume(objs)
-            hv_val = hv.compute(ref_point=reference_point)
+        Returns
+        -------
+        SolutionLineage
+            Lineage of solutions, also stored in `lineage`
+        """
+        # Stacked decisions
+        nfe = list(self.archive_decisions)
+        if hasattr(self, 'archive_store'):
+            decisions = self.archive_store.decisions
+            offsets = self.archive_store.offsets
+        else:
+            arrays = [self.archive_decisions[i] for i in nfe]
+            decisions = np.concatenate(
+                [np.empty((0, self.n_decisions))] + arrays
+            )
+            offsets = np.cumsum([0] + [len(i) for i in arrays])
 
-            # Store value
-            hypervolume_dict[nfe] = hv_val
+        self.lineage = SolutionLineage(nfe, decisions, offsets, decimals)
 
-        self.hypervolume = hypervolume_dict
+        return self.lineage
 
     def plot_improvements(self):
         """
@@ -274,7 +1575,14 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
 
         return fig
 
-    def plot_hypervolume(self, reference_point):
+    def plot_hypervolume(
+        self,
+        reference_point,
+        method='exact',
+        workers=1,
+        samples=100000,
+        seed=None,
+    ):
         """
         Plot hypervolume over the search
 
@@ -282,6 +1590,15 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         ----------
         reference_point : list
             Reference point for hypervolume calculation
+        method : str, optional
+            Hypervolume method, see `compute_hypervolume`. By default
+             `'exact'`
+        workers : int, optional
+            Number of processes, by default 1
+        samples : int, optional
+            Number of Monte Carlo samples per snapshot, by default 100000
+        seed : int, optional
+            Seed of Monte Carlo samples, by default None
 
         Returns
         -------
@@ -291,7 +1608,13 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
         sns.set()
 
         # Computing hypervolume
-        self.compute_hypervolume(reference_point)
+        self.compute_hypervolume(
+            reference_point,
+            method=method,
+            workers=workers,
+            samples=samples,
+            seed=seed
+        )
         df_run = pd.DataFrame()
         df_run['hypervolume'] = pd.Series(self.hypervolume)
         df_run['nfe'] = df_run.index
@@ -304,11 +1627,55 @@ class BorgRuntimeDiagnostic(BorgRuntimeUtils):
             y='hypervolume',
             ax=ax
         )
+        if self.hypervolume_ci is not None:
+            lower, upper = zip(*self.hypervolume_ci.values())
+            ax.fill_between(df_run['nfe'], lower, upper, alpha=0.3)
         plt.ylabel('Hypervolume')
         plt.xlabel('Function Evaluations')
 
         return fig
 
+    def plot_indicator(
+        self,
+        reference_set,
+        indicator='inverted_generational_distance',
+        normalize=False,
+    ):
+        """
+        Plot quality indicator over the search
+
+        Parameters
+        ----------
+        reference_set : numpy.ndarray
+            An (n_reference, n_objectives) array of reference objectives
+        indicator : str, optional
+            Name of indicator, see `compute_indicators`. By default
+             `'inverted_generational_distance'`
+        normalize : bool, optional
+            Scale objectives to the range of the reference set, by default
+             False
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            Plot of indicator
+        """
+        sns.set()
+
+        # Computing indicator
+        self.compute_indicators(reference_set, normalize=normalize)
+        df_run = pd.DataFrame()
+        df_run[indicator] = pd.Series(getattr(self, indicator))
+        df_run['nfe'] = df_run.index
+
+        # Plotting
+        fig = plt.figure()
+        sns.lineplot(data=df_run, x='nfe', y=indicator)
+        plt.ylabel(indicator.replace('_', ' ').title())
+        plt.xlabel('Function Evaluations')
+
+        return fig
+
     def plot_interactive_front(self):
         """
         Create interactive parallel plot
@@ -427,6 +1794,9 @@ class BorgRuntimeAggregator():
     """
     Agregate multiple runs of borg multi-objective algorithm runtime objects
     """
+    # Operator probability attributes
+    operators = ['sbx', 'de', 'pcx', 'spx', 'undx', 'um']
+
     def __init__(
         self,
         runtime_objs,
@@ -441,7 +1811,283 @@ class BorgRuntimeAggregator():
         """
         self.runs = runtime_objs
 
-    def plot_hypervolume(self, reference_point):
+    @classmethod
+    def from_paths(
+        cls,
+        paths,
+        n_decisions,
+        n_objectives,
+        n_metrics,
+        workers=None,
+    ):
+        """
+        Parse multiple runtime files in parallel
+
+        Each runtime file is parsed in a separate process, which writes the
+        binary sidecar next to the runtime file. The sidecars are then loaded
+        in this process.
+
+        Parameters
+        ----------
+        paths : dict
+            Dictionary with keys of run name and values being paths to Borg
+             runtime files
+        n_decisions : int
+            Number of decisions
+        n_objectives : int
+            Number of objectives
+        n_metrics : int
+            Number of metrics
+        workers : int, optional
+            Number of processes, by default number of processors
+
+        Returns
+        -------
+        BorgRuntimeAggregator
+            Aggregated runtime objects
+        """
+        # Parse into sidecars
+        args = (n_decisions, n_objectives, n_metrics)
+        if workers == 1:
+            results = [_parse_runtime(path, *args) for path in paths.values()]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_parse_runtime, path, *args)
+                    for path in paths.values()
+                ]
+                results = [future.result() for future in futures]
+
+        # Load from sidecars (or use transferred object if writing failed)
+        runtime_objs = {}
+        for (run_name, path), runtime in zip(paths.items(), results):
+            if runtime is None:
+                runtime = BorgRuntimeDiagnostic(path, *args)
+            runtime_objs[run_name] = runtime
+
+        return cls(runtime_objs)
+
+    def stack_stats(self, attributes=None):
+        """
+        Stack runtime statistics of all runs
+
+        Runs are aligned on the union of their NFE, with NaN where a run has
+        no snapshot.
+
+        Parameters
+        ----------
+        attributes : list, optional
+            Runtime statistic attributes (e.g., `'pcx'`, `'restarts'`), by
+             default all runtime statistics
+
+        Returns
+        -------
+        tuple
+            Tuple of NFE array and (n_runs, n_nfe, n_attributes) array of
+             statistics
+        """
+        # Setup
+        if attributes is None:
+            attributes = list(BorgRuntimeUtils.stat_attributes.values())
+        nfe = np.unique(np.concatenate([
+            np.asarray(run_obj.nfe, dtype=int)
+            for run_obj in self.runs.values()
+        ]))
+        stats = np.full((len(self.runs), len(nfe), len(attributes)), np.nan)
+
+        # Align runs
+        for i, run_obj in enumerate(self.runs.values()):
+            idx = np.searchsorted(nfe, run_obj.nfe)
+            stats[i, idx] = np.array([
+                list(getattr(run_obj, attr_name).values())
+                for attr_name in attributes
+            ]).reshape(len(attributes), len(idx)).T
+
+        return nfe, stats
+
+    def stat_summary(self, attribute, quantiles=(0.05, 0.5, 0.95)):
+        """
+        Cross-run summary of runtime statistic
+
+        Parameters
+        ----------
+        attribute : str
+            Runtime statistic attribute (e.g., `'pcx'`)
+        quantiles : tuple, optional
+            Quantiles to compute, by default (0.05, 0.5, 0.95)
+
+        Returns
+        -------
+        pandas.DataFrame
+            Mean, quantiles, and number of runs of statistic indexed by NFE
+        """
+        nfe, stats = self.stack_stats([attribute])
+        values = stats[:, :, 0]
+        df = pd.DataFrame(
+            np.nanquantile(values, quantiles, axis=0).T,
+            columns=['q' + str(q) for q in quantiles],
+            index=pd.Index(nfe, name='nfe')
+        )
+        df.insert(0, 'mean', np.nanmean(values, axis=0))
+        df['n_runs'] = np.sum(~np.isnan(values), axis=0)
+
+        return df
+
+    def operator_dominance(self):
+        """
+        Intervals in which each operator has the highest probability
+
+        Snapshots missing from a run (e.g., other runs have more snapshots)
+        do not split its intervals.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Run name, dominant operator, and first and last NFE of each
+             interval
+        """
+        # Dominant operator of latest snapshot of each run (-1 if none)
+        nfe, stats = self.stack_stats(self.operators)
+        latest = _latest_index(~np.all(np.isnan(stats), axis=2))
+        dominant = np.argmax(np.nan_to_num(stats, nan=-np.inf), axis=2)
+        dominant = np.where(
+            latest >= 0,
+            np.take_along_axis(dominant, np.maximum(latest, 0), axis=1),
+            -1
+        )
+
+        # Intervals of unchanged dominant operator
+        n_runs, n_nfe = dominant.shape
+        change = np.ones((n_runs, n_nfe), dtype=bool)
+        change[:, 1:] = dominant[:, 1:] != dominant[:, :-1]
+        starts = np.flatnonzero(change)
+        ends = np.append(starts[1:], dominant.size) - 1
+        operator = dominant.ravel()[starts]
+        valid = operator >= 0
+        starts = starts[valid]
+        ends = latest.ravel()[ends[valid]]
+
+        df = pd.DataFrame({
+            'run_name': np.array(list(self.runs), dtype=object)[
+                starts // n_nfe
+            ],
+            'operator': np.array(self.operators)[operator[valid]],
+            'start_nfe': nfe[starts % n_nfe],
+            'end_nfe': nfe[ends],
+        })
+
+        return df
+
+    def restart_frequency(self):
+        """
+        Cross-run frequency of restarts
+
+        Returns
+        -------
+        pandas.DataFrame
+            Mean cumulative restarts, mean restarts since previous snapshot
+             of each run, and fraction of runs restarting since previous
+             snapshot indexed by NFE
+        """
+        # Restarts since previous snapshot of each run
+        nfe, stats = self.stack_stats(['restarts'])
+        restarts = stats[:, :, 0]
+        present = ~np.isnan(restarts)
+        latest = _latest_index(present)
+        previous = np.full(restarts.shape, -1)
+        previous[:, 1:] = latest[:, :-1]
+        previous_restarts = np.where(
+            previous >= 0,
+            np.take_along_axis(restarts, np.maximum(previous, 0), axis=1),
+            0.0
+        )
+        new_restarts = restarts - previous_restarts
+        restarted = np.where(present, new_restarts > 0, np.nan)
+
+        df = pd.DataFrame(
+            {
+                'mean_restarts': np.nanmean(restarts, axis=0),
+                'mean_new_restarts': np.nanmean(new_restarts, axis=0),
+                'fraction_restarting': np.nanmean(restarted, axis=0),
+            },
+            index=pd.Index(nfe, name='nfe')
+        )
+
+        return df
+
+    def reference_set(self, epsilons, snapshots='final'):
+        """
+        Epsilon-box nondominated reference set of all runs
+
+        Parameters
+        ----------
+        epsilons : list
+            Epsilon of each objective, as set for the Borg problem (e.g., 1e6
+             for costs, 0.1 for f_ENS, and 1e-8 for weights)
+        snapshots : str, optional
+            Merge the `'final'` snapshot or `'all'` snapshots of each run, by
+             default `'final'`
+
+        Returns
+        -------
+        pandas.DataFrame
+            Decisions, objectives, and metrics of reference set with run name
+             and NFE of each solution
+        """
+        # Setup
+        if snapshots not in ['final', 'all']:
+            raise ValueError(
+                'snapshots must be `final` or `all`, got {}'.format(snapshots)
+            )
+        decisions = []
+        objectives = []
+        metrics = []
+        run_names = []
+        nfe = []
+
+        # Merge snapshots
+        for run_name, run_obj in self.runs.items():
+            if snapshots == 'final':
+                run_nfe = run_obj.nfe[-1:]
+            else:
+                run_nfe = list(run_obj.archive_objectives)
+            for i in run_nfe:
+                objs = run_obj.archive_objectives[i]
+                decisions.append(run_obj.archive_decisions[i])
+                objectives.append(objs)
+                metrics.append(run_obj.archive_metrics[i])
+                run_names.append(np.full(len(objs), run_name, dtype=object))
+                nfe.append(np.full(len(objs), i))
+        objectives = np.concatenate(objectives)
+
+        # Epsilon nondominance
+        idx = postmocot.process.epsilon_nondominated(objectives, epsilons)
+        df_decs = pd.DataFrame(
+            np.concatenate(decisions)[idx],
+            columns=run_obj.decision_names
+        )
+        df_objs = pd.DataFrame(
+            objectives[idx],
+            columns=run_obj.objective_names
+        )
+        df_metrics = pd.DataFrame(
+            np.concatenate(metrics)[idx],
+            columns=run_obj.metric_names
+        )
+        df = pd.concat([df_decs, df_objs, df_metrics], axis=1)
+        df['run_name'] = np.concatenate(run_names)[idx]
+        df['nfe'] = np.concatenate(nfe)[idx]
+
+        return df
+
+    def plot_hypervolume(
+        self,
+        reference_point,
+        method='exact',
+        workers=1,
+        samples=100000,
+        seed=None,
+    ):
         """
         Plot hypervolume over the search
 
@@ -449,6 +2095,15 @@ class BorgRuntimeAggregator():
         ----------
         reference_point : list
             Reference point for hypervolume calculation
+        method : str, optional
+            Hypervolume method, see
+             `BorgRuntimeDiagnostic.compute_hypervolume`. By default `'exact'`
+        workers : int, optional
+            Number of processes, by default 1
+        samples : int, optional
+            Number of Monte Carlo samples per snapshot, by default 100000
+        seed : int, optional
+            Seed of Monte Carlo samples, by default None
 
         Returns
         -------
@@ -461,8 +2116,18 @@ class BorgRuntimeAggregator():
         # Computing hypervolume
         for run_name, run_obj in self.runs.items():
             df_run = pd.DataFrame()
-            run_obj.compute_hypervolume(reference_point)
+            run_obj.compute_hypervolume(
+                reference_point,
+                method=method,
+                workers=workers,
+                samples=samples,
+                seed=seed
+            )
             df_run['hypervolume'] = pd.Series(run_obj.hypervolume)
+            if run_obj.hypervolume_ci is not None:
+                lower, upper = zip(*run_obj.hypervolume_ci.values())
+                df_run['hypervolume_lower'] = lower
+                df_run['hypervolume_upper'] = upper
             df_run['run_name'] = run_name
             df_run['nfe'] = df_run.index
             df_ls.append(df_run)
@@ -471,12 +2136,72 @@ class BorgRuntimeAggregator():
         # Plotting
         fig, ax = plt.subplots()
         sns.lineplot(data=df, x='nfe', y='hypervolume', hue='run_name', ax=ax)
+        if 'hypervolume_lower' in df:
+            for line, (_, df_run) in zip(
+                ax.get_lines(),
+                df.groupby('run_name', sort=False)
+            ):
+                ax.fill_between(
+                    df_run['nfe'],
+                    df_run['hypervolume_lower'],
+                    df_run['hypervolume_upper'],
+                    color=line.get_color(),
+                    alpha=0.3
+                )
         plt.ylabel('Hypervolume')
         plt.xlabel('Function Evaluations')
         ax.legend(title='Run')
 
         return fig
 
+    def plot_indicator(
+        self,
+        reference_set,
+        indicator='inverted_generational_distance',
+        normalize=False,
+    ):
+        """
+        Plot quality indicator over the search
+
+        Parameters
+        ----------
+        reference_set : numpy.ndarray
+            An (n_reference, n_objectives) array of reference objectives
+        indicator : str, optional
+            Name of indicator, see
+             `BorgRuntimeDiagnostic.compute_indicators`. By default
+             `'inverted_generational_distance'`
+        normalize : bool, optional
+            Scale objectives to the range of the reference set, by default
+             False
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            Plot of indicator
+        """
+        sns.set()
+
+        # Computing indicator
+        df_ls = []
+        for run_name, run_obj in self.runs.items():
+            run_obj.compute_indicators(reference_set, normalize=normalize)
+            df_run = pd.DataFrame()
+            df_run[indicator] = pd.Series(getattr(run_obj, indicator))
+            df_run['run_name'] = run_name
+            df_run['nfe'] = df_run.index
+            df_ls.append(df_run)
+        df = pd.concat(df_ls)
+
+        # Plotting
+        fig, ax = plt.subplots()
+        sns.lineplot(data=df, x='nfe', y=indicator, hue='run_name', ax=ax)
+        plt.ylabel(indicator.replace('_', ' ').title())
+        plt.xlabel('Function Evaluations')
+        ax.legend(title='Run')
+
+        return fig
+
     def plot_interactive_front(self):
         """
         Plot interactive front at final search
@@ -547,44 +2272,53 @@ class BorgRuntimeAggregator():
         pandas.DataFrame
             Results of subsequent nondomination
         """
-        df_parent = pd.DataFrame()
-
-        for r_name, runtime in self.runs.items():
-            # Setup
-            df_scenario = pd.DataFrame()
+        # Setup
+        archives = []
+        is_efficient = []
 
+        for runtime in self.runs.values():
             # Get archive
             nfe = runtime.nfe[-1]
             df_archive = pd.DataFrame(
                 runtime.archive_objectives[nfe],
                 columns=runtime.objective_names
             )
+            archives.append(df_archive)
 
             # Subsequent non-domination
-            for i in range(len(nondom_col_order)):
-
-                # Run non-domination
-                nondom_cols = nondom_col_order[0:i+1]
-                df_nondom = postmocot.process.get_nondomintated(
-                    df=df_archive,
-                    objs=nondom_cols,
-                    max_objs=None
-                )
-
-                # Store
-                df_nondom['nondomination_cols'] = str(nondom_cols)
-                df_scenario = pd.concat(
-                    [df_scenario, df_nondom],
-                    axis=0
+            is_efficient.append(
+                postmocot.process.prefix_pareto_efficient(
+                    df_archive[nondom_col_order].values
                 )
-
-            # Storing
-            df_scenario['scenario'] = r_name
-            df_parent = pd.concat(
-                [df_parent, df_scenario],
-                axis=0
             )
 
+        # Preallocate results
+        n_rows = sum(int(i.sum()) for i in is_efficient)
+        columns = archives[0].columns
+        values = np.empty((n_rows, len(columns)))
+        index = np.empty(n_rows, dtype=int)
+        nondomination_cols = np.empty(n_rows, dtype=object)
+        scenario = np.empty(n_rows, dtype=object)
+
+        # Store
+        row = 0
+        for r_name, df_archive, run_efficient in zip(
+            self.runs, archives, is_efficient
+        ):
+            for i in range(len(nondom_col_order)):
+                idx = np.flatnonzero(run_efficient[i])
+                rows = slice(row, row + len(idx))
+                values[rows] = df_archive.values[idx]
+                index[rows] = np.arange(len(idx))
+                nondomination_cols[rows] = str(nondom_col_order[0:i+1])
+                scenario[rows] = r_name
+                row += len(idx)
+
+        # Build DataFrame
+        df_parent = pd.DataFrame(values, columns=columns, index=index)
+        df_parent['nondomination_cols'] = nondomination_cols
+        df_parent['scenario'] = scenario
+
         return df_parent
 
     def plot_subequent_nondomination(
@@ -656,3 +2390,553 @@ class BorgRuntimeAggregator():
         g.figure.subplots_adjust(right=0.7)
 
         return g
+
+
+class BorgConvergenceMonitor:
+    """
+    Convergence monitor of a running Borg optimization
+    """
+    def __init__(
+        self,
+        runtime,
+        reference_point,
+        method='exact',
+        samples=10000,
+        seed=None,
+        window=5,
+        hypervolume_tolerance=1e-3,
+        improvements_tolerance=None,
+        churn_tolerance=None,
+        min_nfe=0,
+        path_to_status=None,
+        path_to_flag=None,
+        decimals=10,
+    ):
+        """
+        Initilization
+
+        Each criterion is evaluated over the last `window` snapshots and the
+        optimization is stagnant when all criteria that are not None are
+        met.
+
+        Parameters
+        ----------
+        runtime : BorgRuntimeDiagnostic
+            Runtime diagnostic of the growing runtime file
+        reference_point : list
+            Reference point for hypervolume calculation. Length must be same
+             as objectives. Points outside the reference point are ignored
+        method : str, optional
+            `'exact'` tracks the hypervolume of consecutive snapshots (updated
+             incrementally when few points changed) or `'mc'` estimates it by
+             Monte Carlo sampling (much faster for many objectives), by
+             default `'exact'`
+        samples : int, optional
+            Number of Monte Carlo samples per snapshot, by default 10000
+        seed : int, optional
+            Seed of Monte Carlo samples, by default None. A seed reuses the
+             same samples for every snapshot, which reduces the noise of
+             hypervolume gains
+        window : int, optional
+            Number of snapshots criteria are evaluated over, by default 5
+        hypervolume_tolerance : float, optional
+            Maximum hypervolume gain relative to the current hypervolume, by
+             default 1e-3
+        improvements_tolerance : int, optional
+            Maximum number of epsilon-progress improvements, by default None
+        churn_tolerance : float, optional
+            Maximum mean fraction of the archive replaced per snapshot, by
+             default None
+        min_nfe : int, optional
+            Number of function evaluations before the optimization can be
+             stagnant, by default 0
+        path_to_status : str, optional
+            Path to JSON status file written after every update, by default
+             None
+        path_to_flag : str, optional
+            Path to stop flag file created once stagnant, by default None
+        decimals : int, optional
+            Decimals of decisions identifying a solution, by default 10
+        """
+        # Setup
+        if method not in ['exact', 'mc']:
+            raise ValueError(
+                'method must be `exact` or `mc`, got {}'.format(method)
+            )
+        if window < 1:
+            raise ValueError('window must be positive, got {}'.format(window))
+        self.runtime = runtime
+        self.reference_point = np.asarray(reference_point, dtype=float)
+        self.method = method
+        self.samples = samples
+        self.seed = seed
+        self.window = window
+        self.hypervolume_tolerance = hypervolume_tolerance
+        self.improvements_tolerance = improvements_tolerance
+        self.churn_tolerance = churn_tolerance
+        self.min_nfe = min_nfe
+        self.path_to_status = path_to_status
+        self.path_to_flag = path_to_flag
+        self.decimals = decimals
+
+        # Per-snapshot indicators
+        self.tracker = postmocot.hypervolume.HypervolumeTracker(
+            reference_point,
+            incremental=True
+        )
+        self.nfe = []
+        self.hypervolume = []
+        self.improvements = []
+        self.churn = []
+        self._solutions = set()
+        self.stagnant = False
+
+        # Snapshots parsed before monitoring
+        self._extend(list(runtime.archive_objectives))
+
+    def _extend(self, nfe):
+        """
+        Compute indicators of additional snapshots
+
+        Parameters
+        ----------
+        nfe : list
+            Function evaluations of snapshots
+        """
+        for i in nfe:
+            # Hypervolume of points inside reference point
+            objectives = self.runtime.archive_objectives[i]
+            objectives = objectives[
+                np.all(objectives < self.reference_point, axis=1)
+            ]
+            if self.method == 'mc':
+                hypervolume = postmocot.hypervolume.monte_carlo_hypervolume(
+                    objectives,
+                    self.reference_point,
+                    self.samples,
+                    self.seed
+                )[0]
+            else:
+                hypervolume = self.tracker.update(objectives)
+            self.hypervolume.append(float(hypervolume))
+
+            # Fraction of archive not in previous snapshot
+            rows = np.round(self.runtime.archive_decisions[i], self.decimals)
+            solutions = set(postmocot.process._row_keys(rows).tolist())
+            if solutions:
+                added = len(solutions - self._solutions) / len(solutions)
+            else:
+                added = 0.0
+            self.churn.append(added)
+            self._solutions = solutions
+
+            self.improvements.append(self.runtime.improvements[i])
+            self.nfe.append(i)
+
+    def update(self):
+        """
+        Parse new snapshots and evaluate stagnation criteria
+
+        Returns
+        -------
+        dict
+            Status of the optimization
+        """
+        # Indicators of new snapshots
+        self._extend(self.runtime.refresh())
+        status = self.status()
+        self.stagnant = status['stagnant']
+
+        # Signal job script
+        if self.path_to_status is not None:
+            with open(self.path_to_status + '.tmp', 'w') as f:
+                json.dump(status, f, indent=4)
+            os.replace(self.path_to_status + '.tmp', self.path_to_status)
+        if self.path_to_flag is not None and self.stagnant:
+            with open(self.path_to_flag, 'w') as f:
+                f.write(str(self.nfe[-1]) + '\n')
+
+        return status
+
+    def status(self):
+        """
+        Convergence indicators over the last `window` snapshots
+
+        Returns
+        -------
+        dict
+            NFE, hypervolume, relative hypervolume gain, number of
+             improvements, mean churn, and whether each criterion is met and
+             the optimization is stagnant
+        """
+        # Setup
+        status = {
+            'nfe': None,
+            'hypervolume': None,
+            'hypervolume_gain': None,
+            'improvements': None,
+            'churn': None,
+            'criteria': {},
+            'stagnant': False,
+        }
+        if len(self.nfe) == 0:
+            return status
+        status['nfe'] = int(self.nfe[-1])
+        status['hypervolume'] = float(self.hypervolume[-1])
+        if len(self.nfe) <= self.window:
+            return status
+
+        # Indicators over window
+        hv_start = self.hypervolume[-self.window-1]
+        hv_end = self.hypervolume[-1]
+        # Gain is undefined until points are inside reference point
+        if hv_end > 0:
+            status['hypervolume_gain'] = float((hv_end - hv_start) / hv_end)
+        status['improvements'] = int(
+            self.improvements[-1] - self.improvements[-self.window-1]
+        )
+        status['churn'] = float(np.mean(self.churn[-self.window:]))
+
+        # Stagnation criteria
+        tolerances = {
+            'hypervolume_gain': self.hypervolume_tolerance,
+            'improvements': self.improvements_tolerance,
+            'churn': self.churn_tolerance,
+        }
+        for name, tolerance in tolerances.items():
+            if tolerance is not None:
+                status['criteria'][name] = \
+                    status[name] is not None and status[name] <= tolerance
+        status['stagnant'] = \
+            len(status['criteria']) > 0 and \
+            all(status['criteria'].values()) and \
+            status['nfe'] >= self.min_nfe
+
+        return status
+
+    def to_frame(self):
+        """
+        Indicators of every monitored snapshot
+
+        Returns
+        -------
+        pandas.DataFrame
+            Hypervolume, cumulative improvements, and churn indexed by NFE
+        """
+        df = pd.DataFrame(
+            {
+                'hypervolume': self.hypervolume,
+                'improvements': self.improvements,
+                'churn': self.churn,
+            },
+            index=pd.Index(self.nfe, name='nfe')
+        )
+
+        return df
+
+    def watch(self, interval=60, timeout=None):
+        """
+        Update periodically until stagnant
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between updates, by default 60
+        timeout : float, optional
+            Seconds after which to stop watching, by default never
+
+        Returns
+        -------
+        dict
+            Status of the optimization at last update
+        """
+        start = time.monotonic()
+        while True:
+            status = self.update()
+            if status['stagnant']:
+                break
+            if timeout is not None and time.monotonic() - start >= timeout:
+                break
+            time.sleep(interval)
+
+        return status
+
+
+def iter_archives(path, n_decisions, n_objectives, n_metrics):
+    """
+    Stream archive snapshots of Borg MOEA runtime file
+
+    Parameters
+    ----------
+    path : str
+        Path to Borg MOEA runtime file
+    n_decisions : int
+        Number of decisions
+    n_objectives : int
+        Number of objectives
+    n_metrics : int
+        Number of metrics
+
+    Yields
+    ------
+    tuple
+        Tuple of NFE and decisions, objectives, and metrics arrays of
+         snapshot
+    """
+    # Setup
+    utils = BorgRuntimeUtils()
+    utils.n_decisions = n_decisions
+    utils.n_objectives = n_objectives
+    utils.n_metrics = n_metrics
+
+    for stats, decisions, objectives, metrics, _ in \
+            utils._iter_snapshots(path):
+        yield int(stats['NFE']), decisions, objectives, metrics
+
+
+def write_delta_archive(
+    path_to_runtime,
+    path_to_delta,
+    n_decisions,
+    n_objectives,
+    n_metrics,
+    keyframe_interval=100,
+    compress=True,
+):
+    """
+    Convert Borg MOEA runtime file to delta archive file
+
+    The runtime file is streamed one snapshot at a time. Snapshots whose rows
+    are not the previous rows (less removed rows) followed by the added rows
+    are stored as keyframes, as is every `keyframe_interval` snapshot, so
+    every snapshot is reconstructed exactly by `BorgDeltaArchive`.
+
+    Parameters
+    ----------
+    path_to_runtime : str
+        Path to Borg MOEA runtime file
+    path_to_delta : str
+        Path to delta archive file (`.npz`)
+    n_decisions : int
+        Number of decisions
+    n_objectives : int
+        Number of objectives
+    n_metrics : int
+        Number of metrics
+    keyframe_interval : int, optional
+        Number of snapshots between keyframes, bounding the snapshots
+         replayed by `BorgDeltaArchive.archive`, by default 100
+    compress : bool, optional
+        Compress file, by default True
+    """
+    # Setup
+    utils = BorgRuntimeUtils()
+    utils.n_decisions = n_decisions
+    utils.n_objectives = n_objectives
+    utils.n_metrics = n_metrics
+    stat_names = list(BorgRuntimeUtils.stat_attributes)
+    row_ids = {}
+    rows = []
+    nfe = []
+    stats = []
+    added = []
+    removed = []
+    keyframes = []
+    is_keyframe = []
+    previous = []
+
+    for snapshot_stats, decisions, objectives, metrics, _ in \
+            utils._iter_snapshots(path_to_runtime):
+        # Row ids (new rows are numbered in order of appearance)
+        archive = np.concatenate([decisions, objectives, metrics], axis=1)
+        ids = []
+        for row in archive:
+            key = row.tobytes()
+            if key not in row_ids:
+                row_ids[key] = len(rows)
+                rows.append(row)
+            ids.append(row_ids[key])
+
+        # Difference to previous snapshot
+        current = set(ids)
+        kept = [i for i in previous if i in current]
+        kept_set = set(kept)
+        new = [i for i in ids if i not in kept_set]
+        keyframe = \
+            len(nfe) % keyframe_interval == 0 or \
+            kept + new != ids
+        if keyframe:
+            keyframes.append(ids)
+            added.append([])
+            removed.append([])
+        else:
+            keyframes.append([])
+            added.append(new)
+            removed.append([i for i in previous if i not in current])
+        is_keyframe.append(keyframe)
+        previous = ids
+
+        # Runtime statistics
+        nfe.append(int(snapshot_stats['NFE']))
+        stats.append([snapshot_stats.get(i, np.nan) for i in stat_names])
+
+    # Save
+    n_cols = n_decisions + n_objectives + n_metrics
+    added, added_offsets = _ragged(added)
+    removed, removed_offsets = _ragged(removed)
+    keyframe_ids, keyframe_offsets = _ragged(keyframes)
+    savez = np.savez_compressed if compress else np.savez
+    savez(
+        path_to_delta,
+        shape=[n_decisions, n_objectives, n_metrics],
+        nfe=np.array(nfe, dtype=int),
+        stat_names=stat_names,
+        stats=np.array(stats).reshape(len(nfe), len(stat_names)).T,
+        rows=np.array(rows).reshape(len(rows), n_cols),
+        is_keyframe=np.array(is_keyframe, dtype=bool),
+        added=added,
+        added_offsets=added_offsets,
+        removed=removed,
+        removed_offsets=removed_offsets,
+        keyframe_ids=keyframe_ids,
+        keyframe_offsets=keyframe_offsets,
+    )
+
+
+def _ragged(lists):
+    """
+    Concatenated values and offsets of lists
+
+    Parameters
+    ----------
+    lists : list
+        Lists of values
+
+    Returns
+    -------
+    tuple
+        Tuple of concatenated values and offsets (list `i` spans values
+         `offsets[i]` to `offsets[i+1]`)
+    """
+    values = np.array([i for j in lists for i in j], dtype=np.int64)
+    offsets = np.cumsum([0] + [len(i) for i in lists])
+
+    return values, offsets
+
+
+def _parse_runtime(path, n_decisions, n_objectives, n_metrics):
+    """
+    Parse runtime file into binary sidecar (process pool worker)
+
+    Parameters
+    ----------
+    path : str
+        Path to Borg runtime file
+    n_decisions : int
+        Number of decisions
+    n_objectives : int
+        Number of objectives
+    n_metrics : int
+        Number of metrics
+
+    Returns
+    -------
+    BorgRuntimeDiagnostic or None
+        Runtime object if sidecar could not be read or written, otherwise
+         None
+    """
+    runtime = BorgRuntimeDiagnostic(
+        path,
+        n_decisions,
+        n_objectives,
+        n_metrics
+    )
+    if runtime.cached:
+        return None
+
+    return runtime
+
+
+def _latest_index(present):
+    """
+    Index of latest present column in each row
+
+    Parameters
+    ----------
+    present : numpy.ndarray
+        An (n_rows, n_columns) boolean array
+
+    Returns
+    -------
+    numpy.ndarray
+        Index of latest present column up to each column, -1 if none
+    """
+    idx = np.where(present, np.arange(present.shape[1]), -1)
+
+    return np.maximum.accumulate(idx, axis=1)
+
+
+def _sorted_isin(values, sorted_array):
+    """
+    Membership of values in sorted array
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values to find
+    sorted_array : numpy.ndarray
+        Sorted array
+
+    Returns
+    -------
+    numpy.ndarray
+        Whether each value is in array
+    """
+    if len(sorted_array) == 0:
+        return np.zeros(len(values), dtype=bool)
+    idx = np.searchsorted(sorted_array, values)
+    idx[idx == len(sorted_array)] = 0
+
+    return sorted_array[idx] == values
+
+
+def _is_compressed(path):
+    """
+    Check whether runtime file is compressed
+
+    Parameters
+    ----------
+    path : str
+        Path to Borg runtime file
+
+    Returns
+    -------
+    bool
+        Whether file has a `.gz`, `.bz2`, or `.xz` extension
+    """
+    return os.path.splitext(path)[1] in ['.gz', '.bz2', '.xz']
+
+
+def _open_runtime(path):
+    """
+    Open runtime file for binary reading, decompressing if needed
+
+    Parameters
+    ----------
+    path : str
+        Path to Borg runtime file, optionally with `.gz`, `.bz2`, or `.xz`
+         extension
+
+    Returns
+    -------
+    file object
+        Binary file object of (decompressed) runtime file
+    """
+    openers = {
+        '.gz': gzip.open,
+        '.bz2': bz2.open,
+        '.xz': lzma.open,
+    }
+    opener = openers.get(os.path.splitext(path)[1], open)
+
+    return opener(path, 'rb')